@@ -1,13 +1,33 @@
 import os
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 from openai import OpenAI
+
+# HTTP/2 (one multiplexed TLS connection) when the optional h2 package is there.
+try:
+    from openai import DefaultHttpxClient
+    import h2  # noqa: F401  (enables http2=True in httpx)
+except ImportError:
+    DefaultHttpxClient = None
 from src.config import GLOBAL_CONFIG
 from src.audit import GLOBAL_LEDGER
 from src.console import GLOBAL_CONSOLE
 
+# The Wire Tap and Raw Exchange payload files are written by a single background
+# worker, so the caller can parse the response while they go to disk. Ledger events
+# are NOT written there: they stay on the calling thread, in order with the
+# wrapper's own events in ledger/events.jsonl.
+_AUDIT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-audit")
+
+
+def _json_flat_object(fields: list[tuple[str, str]]) -> str:
+    """Assemble a flat JSON object (indent=2) from already-encoded values."""
+    return "{\n" + ",\n".join(f"  {json.dumps(k)}: {v}" for k, v in fields) + "\n}"
+
 
 class AIClient:
     def __init__(self):
@@ -17,8 +37,22 @@ class AIClient:
         # Récupération du modèle défini dans la policy du projet
         self.model_name = GLOBAL_CONFIG.config.get("policy", {}).get("model_alias", "gpt-4o")  # Fallback safe
 
-        # Initialisation du client officiel
-        self.client = OpenAI(api_key=self.api_key)
+        # Initialisation du client officiel. Le client (et son pool de connexions
+        # keep-alive) est réutilisé pour toute la session REPL : seule la première
+        # requête paie la poignée de main TLS.
+        http_client = DefaultHttpxClient(http2=True) if DefaultHttpxClient is not None else None
+        self.client = OpenAI(api_key=self.api_key, http_client=http_client)
+
+        # Final system prompts (base + governance blocks), built once per base prompt.
+        # Rebound turns reuse the same base prompt, so the next request only has
+        # to attach the new user prompt.
+        self._system_prompt_cache: dict[str, str] = {}
+        # JSON-escaped form of each final system prompt, for the Wire Tap records.
+        self._system_prompt_json: dict[str, str] = {}
+
+    def close(self) -> None:
+        """Ferme le pool de connexions HTTP (fin de session)."""
+        self.client.close()
 
     def _load_api_key(self) -> str:
         """Lit la clé API depuis le fichier secret non-versionné."""
@@ -69,7 +103,14 @@ class AIClient:
     # -----------------------------
     # Wire Tap (Interaction Logging)
     # -----------------------------
-    def _log_interaction(self, request_id: str, system_prompt: str, user_prompt: str, response_text: str) -> None:
+    def _log_interaction(
+        self,
+        request_id: str,
+        session_date: str,
+        system_prompt: str,
+        user_prompt: str,
+        response_text: str,
+    ) -> None:
         """Wire Tap: log the high-level interaction in an append-only way.
 
         This is intentionally lightweight and separate from raw exchanges.
@@ -78,47 +119,43 @@ class AIClient:
         Storage:
           sessions/<YYYY-MM-DD>/wire_tap/<uuid>.json
 
+        The matching `wire_tap` ledger event is written by send_chat_request.
+
         Safety:
           - Best-effort: failures must not crash the workflow.
           - Does not store secrets (API key not included).
         """
         try:
-            session_date = datetime.now().strftime("%Y-%m-%d")
             tap_dir = self.project_root / "sessions" / session_date / "wire_tap"
             tap_dir.mkdir(parents=True, exist_ok=True)
 
             tap_path = tap_dir / f"{request_id}.json"
 
-            payload = {
-                "request_id": request_id,
-                "timestamp": datetime.now().isoformat(),
-                "model_used": self.model_name,
-                "system_prompt": system_prompt,
-                "user_prompt": user_prompt,
-                "response_text": response_text,
-            }
+            # Same document as json.dump(payload, f, indent=2); the (large, constant)
+            # system prompt is escaped once per prompt instead of once per call.
+            system_json = self._system_prompt_json.get(system_prompt)
+            if system_json is None:
+                system_json = json.dumps(system_prompt)
+                self._system_prompt_json[system_prompt] = system_json
+
+            document = _json_flat_object([
+                ("request_id", json.dumps(request_id)),
+                ("timestamp", json.dumps(datetime.now().isoformat())),
+                ("model_used", json.dumps(self.model_name)),
+                ("system_prompt", system_json),
+                ("user_prompt", json.dumps(user_prompt)),
+                ("response_text", json.dumps(response_text)),
+            ])
 
             with open(tap_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
-
-            # Optional ledger link (best effort)
-            try:
-                payload_ref = f"sessions/{session_date}/wire_tap/{request_id}.json"
-                GLOBAL_LEDGER.log_event(
-                    actor="wrapper",
-                    action_type="wire_tap",
-                    payload_ref=payload_ref,
-                    artifacts=[payload_ref],
-                )
-            except Exception:
-                pass
+                f.write(document)
 
         except Exception as e:
             # Must not crash the main flow
             GLOBAL_CONSOLE.error(f"Wire Tap logging failed: {e}")
 
-    def _log_raw_exchange(self, request_id: str, raw_data: dict) -> tuple[Path, str] | tuple[None, None]:
-        """Persist the raw request/response exchange to the date-scoped session path.
+    def _raw_exchange_path(self, request_id: str, session_date: str) -> tuple[Path, str] | tuple[None, None]:
+        """Reserve the date-scoped path of the raw request/response exchange.
 
         Enforces structure:
           sessions/<YYYY-MM-DD>/raw_exchanges/<uuid>.json
@@ -130,7 +167,6 @@ class AIClient:
           - Ensures the date folder exists.
           - Handles permission errors gracefully (returns (None, None)).
         """
-        session_date = datetime.now().strftime("%Y-%m-%d")
         raw_filename = f"{request_id}.json"
         raw_path = self.project_root / "sessions" / session_date / "raw_exchanges" / raw_filename
 
@@ -144,18 +180,18 @@ class AIClient:
             GLOBAL_CONSOLE.error(f"Failed to create raw exchange directory {raw_path.parent}: {e}")
             return None, None
 
+        payload_ref = f"sessions/{session_date}/raw_exchanges/{raw_filename}"
+        return raw_path, payload_ref
+
+    def _log_raw_exchange(self, raw_path: Path, raw_data: dict) -> None:
+        """Persist the raw request/response exchange to the path reserved by _raw_exchange_path."""
         try:
             with open(raw_path, "w", encoding="utf-8") as f:
                 json.dump(raw_data, f, indent=2)
         except PermissionError as e:
             GLOBAL_CONSOLE.error(f"Permission error writing raw exchange {raw_path}: {e}")
-            return None, None
         except Exception as e:
             GLOBAL_CONSOLE.error(f"Failed to write raw exchange {raw_path}: {e}")
-            return None, None
-
-        payload_ref = f"sessions/{session_date}/raw_exchanges/{raw_filename}"
-        return raw_path, payload_ref
 
     def build_system_prompt(self, base_system_prompt: str) -> str:
         """Build the final system prompt with mandatory governance instructions.
@@ -183,13 +219,30 @@ class AIClient:
 
         return f"{base}{trinity_block}{tool_usage_block}"
 
-    def send_chat_request(self, system_prompt: str, user_prompt: str) -> tuple[str, dict]:
-        """Envoie une requête à l'IA, logue tout (WireTap + Raw + Ledger), et retourne (content, usage_stats)."""
+    def _get_system_prompt(self, base_system_prompt: str) -> str:
+        """Return build_system_prompt(base_system_prompt), memoized per base prompt."""
+        built = self._system_prompt_cache.get(base_system_prompt)
+        if built is None:
+            built = self.build_system_prompt(base_system_prompt)
+            self._system_prompt_cache[base_system_prompt] = built
+        return built
+
+    def send_chat_request(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> tuple[str, dict]:
+        """Envoie une requête à l'IA, logue tout (WireTap + Raw + Ledger), et retourne (content, usage_stats).
+
+        on_delta : si fourni, la réponse est reçue en streaming et chaque fragment de
+        texte lui est passé dès son arrivée (le retour reste le contenu complet).
+        """
         request_id = str(uuid.uuid4())
         timestamp = datetime.now().isoformat()
 
         # Ensure the final system prompt includes governance blocks.
-        system_prompt = self.build_system_prompt(system_prompt)
+        system_prompt = self._get_system_prompt(system_prompt)
 
         # 1. Préparation de la payload
         messages = [
@@ -200,53 +253,155 @@ class AIClient:
         GLOBAL_CONSOLE.print(f"Connecting to AI ({self.model_name})...")
 
         try:
-            # 2. Appel API réel
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=0.7,
+            if on_delta is not None:
+                # 2-3b. Appel API en streaming
+                content, usage_stats, response = self._stream_completion(messages, on_delta)
+            else:
+                # 2. Appel API réel
+                response = self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=0.7,
+                )
+
+                # 3. Extraction de la réponse
+                content = response.choices[0].message.content
+
+                # 3b. Extraction usage stats (tokens)
+                usage_stats = self._extract_usage_stats(response)
+
+        except Exception as e:
+            GLOBAL_CONSOLE.error(f"API Call Failed: {e}")
+            raise e
+
+        # 3c-5. Les références (Wire Tap, Raw) sont fixées ici et les événements
+        # Ledger écrits sur ce thread, avant ceux que la réponse va déclencher ;
+        # seule l'écriture des payloads part en arrière-plan.
+        session_date = datetime.now().strftime("%Y-%m-%d")
+        tap_ref = f"sessions/{session_date}/wire_tap/{request_id}.json"
+        try:
+            GLOBAL_LEDGER.log_event(
+                actor="wrapper",
+                action_type="wire_tap",
+                payload_ref=tap_ref,
+                artifacts=[tap_ref],
             )
+        except Exception:
+            pass
+
+        # If the raw exchange directory cannot be created, still log the event without payload_ref.
+        raw_path, payload_ref = self._raw_exchange_path(request_id=request_id, session_date=session_date)
+        GLOBAL_LEDGER.log_event(
+            actor="ai_model",
+            action_type="api_response",
+            payload_ref=payload_ref,
+            artifacts=[],
+        )
 
-            # 3. Extraction de la réponse
-            content = response.choices[0].message.content
+        _AUDIT_WRITER.submit(
+            self._persist_exchange,
+            request_id=request_id,
+            timestamp=timestamp,
+            session_date=session_date,
+            messages=messages,
+            response=response,
+            content=content,
+            usage_stats=usage_stats,
+            raw_path=raw_path,
+        )
+
+        return content, usage_stats
 
-            # 3b. Extraction usage stats (tokens)
-            usage_stats = self._extract_usage_stats(response)
+    def _stream_completion(self, messages: list[dict], on_delta: Callable[[str], None]) -> tuple[str, dict, dict]:
+        """Streamed chat completion: returns (content, usage_stats, raw_response dict).
 
+        The raw response is rebuilt in the non-streamed shape so the Raw Exchange
+        record keeps the same structure.
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        pieces: list[str] = []
+        usage_stats = self._extract_usage_stats(None)
+        response_id = None
+        model = self.model_name
+        finish_reason = None
+
+        for chunk in stream:
+            response_id = response_id or getattr(chunk, "id", None)
+            model = getattr(chunk, "model", None) or model
+            if getattr(chunk, "usage", None) is not None:
+                usage_stats = self._extract_usage_stats(chunk)
+            for choice in (getattr(chunk, "choices", None) or []):
+                delta = getattr(getattr(choice, "delta", None), "content", None)
+                if delta:
+                    pieces.append(delta)
+                    on_delta(delta)
+                finish_reason = getattr(choice, "finish_reason", None) or finish_reason
+
+        content = "".join(pieces)
+        raw_response = {
+            "id": response_id,
+            "object": "chat.completion",
+            "model": model,
+            "streamed": True,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": finish_reason,
+                }
+            ],
+            "usage": dict(usage_stats),
+        }
+        return content, usage_stats, raw_response
+
+    def _persist_exchange(
+        self,
+        request_id: str,
+        timestamp: str,
+        session_date: str,
+        messages: list[dict],
+        response,
+        content: str,
+        usage_stats: dict,
+        raw_path: Path | None,
+    ) -> None:
+        """Write the Wire Tap and Raw Exchange payload files for one API call.
+
+        Runs on the background audit writer; failures are reported, never raised.
+        """
+        try:
             # 3c. Wire Tap log (best-effort)
             self._log_interaction(
                 request_id=request_id,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
+                session_date=session_date,
+                system_prompt=messages[0]["content"],
+                user_prompt=messages[1]["content"],
                 response_text=content,
             )
 
             # 4. Sauvegarde des échanges bruts (Raw Exchange)
+            if raw_path is None:
+                return
             raw_data = {
                 "request_id": request_id,
                 "timestamp": timestamp,
                 "model_used": self.model_name,
                 "input_messages": messages,
                 "usage_stats": usage_stats,
-                "raw_response": response.model_dump(),  # Sérialise l'objet réponse complet
+                # Sérialise l'objet réponse complet (dict déjà reconstruit en streaming)
+                "raw_response": response if isinstance(response, dict) else response.model_dump(),
             }
 
-            _raw_path, payload_ref = self._log_raw_exchange(request_id=request_id, raw_data=raw_data)
-
-            # 5. Enregistrement dans le Ledger (Référence vers le fichier raw)
-            # If raw logging failed, still log the event without payload_ref.
-            GLOBAL_LEDGER.log_event(
-                actor="ai_model",
-                action_type="api_response",
-                payload_ref=payload_ref,
-                artifacts=[],
-            )
-
-            return content, usage_stats
-
+            self._log_raw_exchange(raw_path=raw_path, raw_data=raw_data)
         except Exception as e:
-            GLOBAL_CONSOLE.error(f"API Call Failed: {e}")
-            raise e
+            GLOBAL_CONSOLE.error(f"Audit persistence failed for request {request_id}: {e}")
 
 
 # Instance globale (Lazy loading pourrait être mieux, mais simple pour l'instant)
@@ -1,4 +1,5 @@
 import json
+import os
 import re
 import hashlib
 from datetime import datetime, timezone
@@ -7,6 +8,29 @@ from src.config import GLOBAL_CONFIG
 from src.audit import GLOBAL_LEDGER
 from src.console import GLOBAL_CONSOLE
 
+# Optional C-accelerated JSON parser (falls back to the stdlib).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_text_file(path: Path, text: str) -> None:
+    """Equivalent of path.write_text(text, encoding="utf-8") without the
+    buffered/text IO layers: one encode, then raw os.write calls."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)  # same newline translation as text mode
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
 
 class ArtifactManager:
     def __init__(self):
@@ -16,6 +40,14 @@ class ArtifactManager:
 
     def _parse_ndjson(self, text: str) -> list[dict]:
         """Parseur robuste NDJSON."""
+        # Fast path: the usual answer is a single JSON document.
+        try:
+            if orjson is not None:
+                return [orjson.loads(text)]
+            return [json.loads(text)]
+        except ValueError:
+            pass
+
         results = []
         decoder = json.JSONDecoder()
         pos = 0
@@ -54,7 +86,8 @@ class ArtifactManager:
         manifest_path = manifest_dir / f"session_{session_id}_manifest.json"
         
         entries = []
-        for rel_path in self._session_artifacts:
+        # Snapshot: the manifest may be written from a background thread.
+        for rel_path in list(self._session_artifacts):
             full_path = self.project_root / rel_path
             entries.append({
                 "path": rel_path,
@@ -106,6 +139,10 @@ class ArtifactManager:
             GLOBAL_CONSOLE.error("⚠️ No valid JSON block found in AI response.")
             return ([], None) if enable_rebound else []
 
+        # Resolved once; artifact subfolders are created once each.
+        step_dir_abs = step_dir.resolve()
+        created_dirs: set[Path] = {step_dir_abs}
+
         # 3. Traitement
         for obj in json_objects:
             if "thought_process" in obj:
@@ -156,7 +193,6 @@ class ArtifactManager:
                     # 2. On utilise .resolve() pour gérer les ../ éventuels
                     try:
                         safe_target = (step_dir / path_str).resolve()
-                        step_dir_abs = step_dir.resolve()
 
                         # Sécurité : Vérifier que le fichier reste dans step_dir
                         if not str(safe_target).startswith(str(step_dir_abs)):
@@ -164,10 +200,12 @@ class ArtifactManager:
                             continue
                         
                         # Création des sous-dossiers (ex: artifacts/step_X/specs/)
-                        safe_target.parent.mkdir(parents=True, exist_ok=True)
+                        if safe_target.parent not in created_dirs:
+                            safe_target.parent.mkdir(parents=True, exist_ok=True)
+                            created_dirs.add(safe_target.parent)
 
                         # Écriture
-                        safe_target.write_text(content, encoding="utf-8")
+                        _write_text_file(safe_target, content)
                         
                         # Meta-data sidecar
                         meta = {
@@ -175,8 +213,9 @@ class ArtifactManager:
                             "operation": operation,
                             "local_path": str(safe_target)
                         }
-                        safe_target.with_suffix(safe_target.suffix + ".meta.json").write_text(
-                            json.dumps(meta, indent=2), encoding="utf-8"
+                        _write_text_file(
+                            safe_target.with_suffix(safe_target.suffix + ".meta.json"),
+                            json.dumps(meta, indent=2),
                         )
 
                         generated_files.append(str(safe_target))
@@ -1,4 +1,5 @@
 import json
+import mmap
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -6,6 +7,9 @@ from src.config import GLOBAL_CONFIG
 
 
 class AuditLedger:
+    # Counters persisted in the incremental report sidecar.
+    _REPORT_COUNTERS = ("total_requests", "total_input_tokens", "total_output_tokens")
+
     def __init__(self):
         self.project_root = GLOBAL_CONFIG.project_root
 
@@ -103,15 +107,7 @@ class AuditLedger:
         # Determine filter date for 'session'/'today'
         today = datetime.now().strftime("%Y-%m-%d")
 
-        totals = {
-            "timeframe": tf,
-            "total_requests": 0,
-            "total_input_tokens": 0,
-            "total_output_tokens": 0,
-            "estimated_cost_usd": 0.0,
-            "pricing_rates": dict(getattr(GLOBAL_CONFIG, "PRICING_RATES", {}) or {}),
-            "ledger_file": str(self.audit_log_file),
-        }
+        totals = self._empty_report(tf)
 
         # If file missing, return zeros
         try:
@@ -130,8 +126,7 @@ class AuditLedger:
         if not lines:
             return totals
 
-        input_rate = float(totals["pricing_rates"].get("input_per_1m", 0.0) or 0.0)
-        output_rate = float(totals["pricing_rates"].get("output_per_1m", 0.0) or 0.0)
+        filter_today = tf in {"session", "today"}
 
         for line in lines:
             line = (line or "").strip()
@@ -144,26 +139,100 @@ class AuditLedger:
                 continue
 
             # Timeframe filter
-            if tf in {"session", "today"}:
+            if filter_today:
                 session_id = str(entry.get("session_id", "") or "")
                 if session_id != today:
                     continue
 
-            usage = entry.get("usage_stats") or {}
-            pt = int(usage.get("prompt_tokens", 0) or 0)
-            ct = int(usage.get("completion_tokens", 0) or 0)
+            self._accumulate_entry(entry, totals)
 
-            totals["total_requests"] += 1
-            totals["total_input_tokens"] += pt
-            totals["total_output_tokens"] += ct
+        self._apply_cost(totals)
+        return totals
 
-        # Cost computation
+    def generate_report_incremental(self) -> dict:
+        """Same aggregates as generate_report("all"), replaying only the new bytes.
+
+        A sidecar (audit_log.jsonl.agg) keeps {inode, offset, counters}. Only the
+        complete lines appended after `offset` are parsed (mmap). The sidecar is
+        ignored, i.e. full rescan from offset 0, when it is missing/unreadable or
+        when the log was replaced or truncated.
+        """
+        totals = self._empty_report("all")
+        agg_file = self.audit_log_file.with_name(self.audit_log_file.name + ".agg")
+
+        try:
+            st = self.audit_log_file.stat()
+        except OSError:
+            return totals
+
+        offset = 0
+        try:
+            state = json.loads(agg_file.read_text(encoding="utf-8"))
+            if state.get("inode") == st.st_ino and 0 <= int(state.get("offset", -1)) <= st.st_size:
+                offset = int(state["offset"])
+                for key in self._REPORT_COUNTERS:
+                    totals[key] = int(state.get(key, 0) or 0)
+        except Exception:
+            pass
+
+        if st.st_size > offset:
+            try:
+                with open(self.audit_log_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Stop at the last newline: a line still being appended is left for next time.
+                    end = mm.rfind(b"\n", offset) + 1
+                    if end > offset:
+                        mm.seek(offset)
+                        while mm.tell() < end:
+                            line = mm.readline().strip()
+                            if not line:
+                                continue
+                            try:
+                                entry = json.loads(line)
+                            except Exception:
+                                continue
+                            self._accumulate_entry(entry, totals)
+                        offset = end
+            except (OSError, ValueError):
+                return self.generate_report("all")
+
+            state = {"inode": st.st_ino, "offset": offset}
+            for key in self._REPORT_COUNTERS:
+                state[key] = totals[key]
+            try:
+                agg_file.write_text(json.dumps(state), encoding="utf-8")
+            except OSError:
+                pass
+
+        self._apply_cost(totals)
+        return totals
+
+    def _empty_report(self, timeframe: str) -> dict:
+        return {
+            "timeframe": timeframe,
+            "total_requests": 0,
+            "total_input_tokens": 0,
+            "total_output_tokens": 0,
+            "estimated_cost_usd": 0.0,
+            "pricing_rates": dict(getattr(GLOBAL_CONFIG, "PRICING_RATES", {}) or {}),
+            "ledger_file": str(self.audit_log_file),
+        }
+
+    @staticmethod
+    def _accumulate_entry(entry: dict, totals: dict) -> None:
+        usage = entry.get("usage_stats") or {}
+        totals["total_requests"] += 1
+        totals["total_input_tokens"] += int(usage.get("prompt_tokens", 0) or 0)
+        totals["total_output_tokens"] += int(usage.get("completion_tokens", 0) or 0)
+
+    @staticmethod
+    def _apply_cost(totals: dict) -> None:
+        rates = totals["pricing_rates"]
+        input_rate = float(rates.get("input_per_1m", 0.0) or 0.0)
+        output_rate = float(rates.get("output_per_1m", 0.0) or 0.0)
         in_cost = (totals["total_input_tokens"] / 1_000_000.0) * input_rate
         out_cost = (totals["total_output_tokens"] / 1_000_000.0) * output_rate
         totals["estimated_cost_usd"] = float(in_cost + out_cost)
 
-        return totals
-
 
 # Instance globale
 GLOBAL_LEDGER = AuditLedger()
@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from src.config import GLOBAL_CONFIG
@@ -11,6 +12,8 @@ class ConsoleManager:
         self.today = datetime.now().strftime("%Y-%m-%d")
         self.session_dir = self.project_root / "sessions" / self.today
         self.transcript_file = self.session_dir / "transcript.log"
+        # Sérialise écran + transcript (des threads d'arrière-plan peuvent écrire).
+        self._lock = threading.RLock()
         
         self._ensure_session_ready()
 
@@ -26,21 +29,32 @@ class ConsoleManager:
 
     def _write_to_transcript(self, text: str, prefix: str = ""):
         """Écrit dans le fichier log sans perturber la console."""
+        self._write_lines_to_transcript([text], prefix=prefix)
+
+    def _write_lines_to_transcript(self, lines: list[str], prefix: str = ""):
+        """Écrit plusieurs entrées dans le log en un seul append."""
         timestamp = datetime.now().strftime("[%H:%M:%S]")
         try:
             with open(self.transcript_file, 'a', encoding='utf-8') as f:
                 # Nettoyage basique des codes couleur ANSI si besoin (optionnel pour l'instant)
-                f.write(f"{timestamp} {prefix}{text}\n")
+                f.write("".join(f"{timestamp} {prefix}{line}\n" for line in lines))
         except Exception as e:
             # Fallback silencieux pour ne pas crasher l'app si le log échoue
             sys.stderr.write(f"[LOG ERROR] {e}\n")
 
     def print(self, message: str):
         """Remplace print() : Affiche à l'écran ET logue dans le transcript."""
-        # Affichage écran standard
-        print(message)
-        # Enregistrement transcript (Sortie Wrapper)
-        self._write_to_transcript(message, prefix="[WRAPPER] >> ")
+        with self._lock:
+            # Affichage écran standard
+            print(message)
+            # Enregistrement transcript (Sortie Wrapper)
+            self._write_to_transcript(message, prefix="[WRAPPER] >> ")
+
+    def write_block(self, lines: list[str]):
+        """Comme print(), pour un bloc logique : une écriture écran, un append transcript."""
+        with self._lock:
+            sys.stdout.write("\n".join(lines) + "\n")
+            self._write_lines_to_transcript(lines, prefix="[WRAPPER] >> ")
 
     def input(self, prompt_text: str) -> str:
         """Remplace input() : Affiche le prompt, capture la saisie ET logue tout."""
@@ -54,10 +68,25 @@ class ConsoleManager:
         self._write_to_transcript(user_input, prefix="[USER]    << ")
         return user_input
 
+    def echo(self, text: str):
+        """Écran uniquement, sans saut de ligne (fragments d'un flux en cours).
+
+        Le bloc complet doit ensuite être consigné avec log_block().
+        """
+        with self._lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    def log_block(self, lines: list[str]):
+        """Transcript uniquement, pour un bloc déjà affiché au fil de l'eau via echo()."""
+        with self._lock:
+            self._write_lines_to_transcript(lines, prefix="[WRAPPER] >> ")
+
     def error(self, message: str):
         """Affiche une erreur en rouge (simulé) et logue."""
-        print(f"ERROR: {message}", file=sys.stderr)
-        self._write_to_transcript(message, prefix="[ERROR]   !! ")
+        with self._lock:
+            print(f"ERROR: {message}", file=sys.stderr)
+            self._write_to_transcript(message, prefix="[ERROR]   !! ")
 
 # Instance globale
 GLOBAL_CONSOLE = ConsoleManager()
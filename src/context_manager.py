@@ -1,9 +1,16 @@
 import os
+import json
 import tiktoken
 from pathlib import Path
 from src.config import GLOBAL_CONFIG
 from src.console import GLOBAL_CONSOLE
 
+# Cache disque du contexte (survit aux redémarrages du REPL). Même invalidation
+# que le cache mémoire : (mtime_ns, size) par fichier. Incrémenter la version si
+# le format des blocs ou du résumé change.
+_DISK_CACHE_VERSION = 1
+_CONTEXT_HEADER = "=== PROJECT CONTEXT (READ-ONLY) ==="
+
 
 class ContextManager:
     def __init__(self):
@@ -15,6 +22,19 @@ class ContextManager:
             # Fallback si tiktoken a un souci (rare)
             self.encoder = None
 
+        # Cache en mémoire (durée de vie du REPL), invalidé par (mtime_ns, size) :
+        #   - _file_cache    : chemin -> (mtime_ns, size, bloc <file> formaté)
+        #   - _context_cache : scope  -> (signature, texte complet, résumé)
+        # Un appel suivant ne fait qu'un stat par fichier ; seuls les fichiers
+        # modifiés sont relus, et le comptage de tokens est réutilisé si rien n'a changé.
+        self._file_cache: dict[Path, tuple[int, int, str]] = {}
+        self._context_cache: dict[str, tuple[tuple, str, str]] = {}
+
+        # Chargé au premier build (pas à l'import), réécrit après chaque build qui
+        # a dû relire des fichiers.
+        self._disk_cache_path = self.project_root / ".albert_cache" / "context.json"
+        self._disk_cache_loaded = False
+
     def count_tokens(self, text: str) -> int:
         """Estime le nombre de tokens d'un texte."""
         if not self.encoder or not text:
@@ -43,8 +63,20 @@ class ContextManager:
         return False
 
     def build_full_context(self, scope: str = "full") -> str:
+        """Build the project context and print the loaded-context summary line.
+
+        See build_context_with_summary for scopes and ordering.
+        """
+        full_text, summary = self.build_context_with_summary(scope=scope)
+        GLOBAL_CONSOLE.print(summary)
+        return full_text
+
+    def build_context_with_summary(self, scope: str = "full") -> tuple[str, str]:
         """Build the project context with a configurable scope.
 
+        Returns (context_text, summary_line) without printing anything, so it can
+        run in the background (e.g. while the user is typing in nano).
+
         Scopes:
           - "full"    : specs/ + impl-docs/ + src/
           - "code"    : impl-docs/ + src/        (ignore specs/)
@@ -67,10 +99,8 @@ class ContextManager:
         include_impl_docs = True  # always included for all scopes
         include_src = scope in {"full", "code"}
 
-        context_parts: list[str] = []
-        context_parts.append("=== PROJECT CONTEXT (READ-ONLY) ===")
-        # Always show project root (critical context)
-        context_parts.append(f"Project Root: {self.project_root}")
+        # Collect the files in context order, then stat them once.
+        files: list[Path] = []
 
         # 1) specs/
         if include_specs:
@@ -79,8 +109,7 @@ class ContextManager:
                 for f in sorted(specs_dir.glob("*.md")):
                     if self._should_skip_path(f):
                         continue
-                    rel_path = f.relative_to(self.project_root)
-                    context_parts.append(self.get_file_content(str(rel_path)))
+                    files.append(f)
 
         # 2) impl-docs/
         if include_impl_docs:
@@ -89,8 +118,7 @@ class ContextManager:
                 for f in sorted(impl_docs_dir.rglob("*.md")):
                     if self._should_skip_path(f):
                         continue
-                    rel_path = f.relative_to(self.project_root)
-                    context_parts.append(self.get_file_content(str(rel_path)))
+                    files.append(f)
 
         # 3) src/
         if include_src:
@@ -102,8 +130,38 @@ class ContextManager:
                     # Comportement historique: éviter les chemins contenant "__"
                     if "__" in str(f):
                         continue
-                    rel_path = f.relative_to(self.project_root)
-                    context_parts.append(self.get_file_content(str(rel_path)))
+                    files.append(f)
+
+        stats: list[tuple[int, int]] = []
+        for f in files:
+            try:
+                st = f.stat()
+                stats.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append((-1, -1))
+
+        signature = tuple(zip(files, stats))
+        if not self._disk_cache_loaded:
+            self._load_disk_cache()
+        cached = self._context_cache.get(scope)
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
+
+        context_parts: list[str] = []
+        context_parts.append(_CONTEXT_HEADER)
+        # Always show project root (critical context)
+        context_parts.append(f"Project Root: {self.project_root}")
+
+        for f, (mtime_ns, size) in signature:
+            entry = self._file_cache.get(f)
+            if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+                context_parts.append(entry[2])
+                continue
+            rel_path = f.relative_to(self.project_root)
+            block = self.get_file_content(str(rel_path))
+            if mtime_ns >= 0:
+                self._file_cache[f] = (mtime_ns, size, block)
+            context_parts.append(block)
 
         full_text = "\n\n".join(context_parts)
 
@@ -111,11 +169,78 @@ class ContextManager:
         token_count = self.count_tokens(full_text)
         # -2 because we add two headers: context marker + Project Root line
         file_count = max(0, len(context_parts) - 2)
-        GLOBAL_CONSOLE.print(
-            f"Context loaded (scope={scope}): {file_count} files (~{token_count} tokens)"
-        )
+        summary = f"Context loaded (scope={scope}): {file_count} files (~{token_count} tokens)"
 
-        return full_text
+        self._context_cache[scope] = (signature, full_text, summary)
+        self._save_disk_cache()
+        return full_text, summary
+
+    def _load_disk_cache(self) -> None:
+        """Recharge les blocs fichiers et les contextes par scope depuis le disque.
+
+        Best-effort : un cache absent, illisible ou d'une autre version est ignoré.
+        Les entrées sont ensuite validées par build_context_with_summary comme
+        celles du cache mémoire (signature (mtime_ns, size) identique).
+        """
+        self._disk_cache_loaded = True
+        try:
+            with open(self._disk_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _DISK_CACHE_VERSION or data.get("project_root") != str(self.project_root):
+                return
+
+            root = self.project_root
+            blocks: dict[str, str] = {}
+            for rel, (mtime_ns, size, block) in data.get("files", {}).items():
+                blocks[rel] = block
+                self._file_cache.setdefault(root / rel, (mtime_ns, size, block))
+
+            for scope, entry in data.get("scopes", {}).items():
+                sig = entry["signature"]
+                if scope in self._context_cache or any(rel not in blocks for rel, _m, _s in sig):
+                    continue
+                parts = [_CONTEXT_HEADER, f"Project Root: {root}"]
+                parts.extend(blocks[rel] for rel, _m, _s in sig)
+                signature = tuple((root / rel, (m, s)) for rel, m, s in sig)
+                self._context_cache[scope] = (signature, "\n\n".join(parts), entry["summary"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+    def _save_disk_cache(self) -> None:
+        """Écrit les contextes en mémoire (et leurs blocs fichiers) sur disque.
+
+        Écriture atomique (fichier temporaire + os.replace) ; un échec n'interrompt
+        jamais la construction du contexte.
+        """
+        root = self.project_root
+        files: dict[str, list] = {}
+        scopes: dict[str, dict] = {}
+        for scope, (signature, _text, summary) in self._context_cache.items():
+            sig = []
+            for f, (mtime_ns, size) in signature:
+                entry = self._file_cache.get(f)
+                if entry is None or entry[0] != mtime_ns or entry[1] != size:
+                    break  # fichier illisible / disparu : scope non persisté
+                rel = str(f.relative_to(root))
+                files[rel] = list(entry)
+                sig.append((rel, mtime_ns, size))
+            else:
+                scopes[scope] = {"signature": sig, "summary": summary}
+
+        data = {
+            "version": _DISK_CACHE_VERSION,
+            "project_root": str(root),
+            "files": files,
+            "scopes": scopes,
+        }
+        tmp_path = self._disk_cache_path.with_suffix(".json.tmp")
+        try:
+            self._disk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._disk_cache_path)
+        except OSError:
+            pass
 
 
 # Instance globale
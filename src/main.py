@@ -1,26 +1,55 @@
 import os
 import sys
 import argparse
+import atexit
+import functools
+import hashlib
+import itertools
+import math
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
-import tempfile
-import difflib
-import shutil
+import time
 import shlex
-import uuid
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import readline
+except ImportError:  # Windows / minimal builds
+    readline = None
+
+# Optional C implementation of difflib.SequenceMatcher (same API and results).
+try:
+    from cdifflib import CSequenceMatcher
+except ImportError:
+    CSequenceMatcher = None
+
+# Optional fast non-cryptographic hash for the diff cache keys.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from src.config import GLOBAL_CONFIG
 from src.audit import GLOBAL_LEDGER
 from src.console import GLOBAL_CONSOLE
-from src.ai_client import AIClient
-from src.artifact_manager import GLOBAL_ARTIFACTS
 from src.context_manager import GLOBAL_CONTEXT
 from src.system_tools import SafeCommandRunner
-from src.utils import git_add_force_tracked_paths, git_commit_resilient, git_run_ok
+from src.utils import git_add_force_tracked_paths, git_commit_resilient, git_has_staged_changes, git_run_ok
 from src.workbench_runner import WorkbenchRunner
 
+# AIClient (openai SDK) and GLOBAL_ARTIFACTS are imported where they are first
+# needed, so `help`, `status`, `exec` or `exit` do not pay for them at start-up.
+if TYPE_CHECKING:
+    from src.ai_client import AIClient
+
 SYSTEM_PROMPT_ARCHITECT = """
 You are a Senior Python Architect.
 You DO NOT chat. You ONLY output JSON.
@@ -77,6 +106,15 @@ NOTE: If updating an existing file found in context, provide the FULL new conten
 """
 
 
+# Background worker for prefetch work that overlaps user input: the AI client
+# (REPL start) and the project context (while the prompt is being edited).
+_CTX_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-prefetch")
+
+# Single writer for session manifests (runs after the prompt flow returns).
+# Executor workers are joined at interpreter exit, so a pending manifest is not lost.
+_MANIFEST_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="manifest")
+
+
 def _echo_external_editor_input_to_console_and_transcript(content: str) -> None:
     """Echo external editor input into the normal console/log stream.
 
@@ -103,24 +141,56 @@ def _echo_external_editor_input_to_console_and_transcript(content: str) -> None:
     GLOBAL_CONSOLE.print("[END_INPUT]")
 
 
+@functools.lru_cache(maxsize=1)
+def _editor_path() -> str:
+    # PATH lookup done once per process instead of on every editor launch.
+    import shutil  # not needed on the status/help paths
+
+    return shutil.which("nano") or "nano"
+
+
+# Ends a multi-line input read from a non-interactive stdin.
+_PIPED_INPUT_TERMINATOR = "."
+
+
+def _read_piped_input() -> str:
+    """Read lines from stdin up to a lone "." line (or EOF), like mail(1).
+
+    The REPL commands come from the same stream, so stdin is never read to EOF
+    blindly: what follows the terminator is left for the next command.
+    """
+    lines: list[str] = []
+    for line in iter(sys.stdin.readline, ""):
+        line = line.rstrip("\r\n")
+        if line == _PIPED_INPUT_TERMINATOR:
+            break
+        lines.append(line)
+    return "\n".join(lines)
+
+
 def get_input_from_editor(prompt_text: str) -> str:
-    """Collect multi-line user input by opening nano on a temporary file."""
+    """Collect multi-line user input by opening nano on a temporary file.
+
+    When stdin is not a terminal (scripted/CI session) the text is read from
+    stdin directly instead, without launching an editor.
+    """
+    if not sys.stdin.isatty():
+        GLOBAL_CONSOLE.print(f"{prompt_text} (reading stdin; end with a line containing only '.')")
+        content = _read_piped_input()
+        _echo_external_editor_input_to_console_and_transcript(content)
+        return content
+
+    import tempfile  # only needed on the editor path
+
     GLOBAL_CONSOLE.print(f"{prompt_text} (opening nano; save + exit to continue)")
 
     tf_path = None
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w+",
-            delete=False,
-            encoding="utf-8",
-            prefix="AI_TASK_",
-            suffix=".txt",
-            dir=os.getcwd(),
-        ) as tf:
-            tf_path = tf.name
-            tf.flush()
-
-        subprocess.run(["nano", tf_path], check=False)
+        # Empty file in the default temp dir (usually tmpfs) rather than the project tree.
+        fd, tf_path = tempfile.mkstemp(prefix="AI_TASK_", suffix=".txt")
+        os.close(fd)
+
+        subprocess.run([_editor_path(), tf_path], check=False)
 
         with open(tf_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -137,6 +207,129 @@ def get_input_from_editor(prompt_text: str) -> str:
                 pass
 
 
+# Destination file contents already read by show_diff, keyed by path and
+# validated against st_mtime_ns (rebound turns often regenerate the same files).
+_DEST_READ_CACHE: dict[Path, tuple[int, str]] = {}
+
+
+def _read_dest_text(target_path: Path) -> str:
+    """Return the current content of a destination file ("" if missing/unreadable)."""
+    try:
+        mtime_ns = target_path.stat().st_mtime_ns
+    except OSError:
+        _DEST_READ_CACHE.pop(target_path, None)
+        return ""
+
+    cached = _DEST_READ_CACHE.get(target_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        # newline="": keep CRLF as-is so line-ending-only changes stay visible.
+        with open(target_path, "r", encoding="utf-8", newline="") as f:
+            text = f.read()
+    except Exception:
+        return ""
+
+    _DEST_READ_CACHE[target_path] = (mtime_ns, text)
+    return text
+
+
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file content src -> dst, cheapest mechanism first.
+
+    1. FICLONE reflink (btrfs/xfs): copy-on-write, no data moved.
+    2. os.copy_file_range: in-kernel copy, no userspace buffer.
+    3. shutil.copyfile.
+    """
+    if fcntl is not None or hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                if fcntl is not None:
+                    try:
+                        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                        return
+                    except OSError:
+                        pass
+                if hasattr(os, "copy_file_range"):
+                    remaining = os.fstat(src_fd).st_size
+                    while remaining > 0:
+                        n = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if n == 0:
+                            break
+                        remaining -= n
+                    if remaining <= 0:
+                        return
+        except OSError:
+            pass
+    import shutil  # fallback only
+
+    shutil.copyfile(src, dst)
+
+
+# Process umask, read once: staged copies of new files get the mode a plain
+# open() would have given them (mkstemp creates 0600).
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _stage_path(dest_path: Path) -> Path:
+    """Create an empty, uniquely named temp file next to dest_path for os.replace.
+
+    Carries the destination's mode bits (e.g. an executable script stays 0755);
+    a new file gets the default 0666 & ~umask.
+    """
+    import tempfile  # deploy path only
+
+    fd, tmp = tempfile.mkstemp(prefix=f".{dest_path.name}.", suffix=".tmp", dir=dest_path.parent)
+    os.close(fd)
+    try:
+        if dest_path.exists():
+            import shutil  # only when replacing an existing file
+
+            shutil.copymode(dest_path, tmp)
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+    except OSError:
+        os.remove(tmp)
+        raise
+    return Path(tmp)
+
+
+def _same_file_content(src: Path, dst: Path) -> bool:
+    """True if dst exists with exactly the bytes of src (sizes compared first)."""
+    try:
+        if os.stat(src).st_size != os.stat(dst).st_size:
+            return False
+        with open(src, "rb") as fsrc, open(dst, "rb") as fdst:
+            return fsrc.read() == fdst.read()
+    except OSError:
+        return False
+
+
+_DIFF_RED = "\033[31m"
+_DIFF_GREEN = "\033[32m"
+_DIFF_RESET = "\033[0m"
+
+# Body-line marks for _unified_diff: (removed prefix, added prefix, suffix).
+# The color is decided by the opcode, so rendered lines are built in one
+# concatenation and never re-inspected.
+_DIFF_MARKS_PLAIN = ("-", "+", "")
+_DIFF_MARKS_COLORED = (_DIFF_RED + "-", _DIFF_GREEN + "+", _DIFF_RESET)
+
+# Rendered diff payloads (None = no changes), bounded; see show_diff.
+_DIFF_CACHE: dict[tuple, bytes | None] = {}
+_DIFF_CACHE_MAX = 256
+
+# Above this size, a destination whose length changes by more than half is
+# summarized instead of line-diffed.
+_DIFF_SUMMARY_MIN_CHARS = 1_000_000
+
+
 def show_diff(
     target_path: str | Path,
     new_content: str,
@@ -148,78 +341,241 @@ def show_diff(
     """
     target_path = Path(target_path)
 
-    old_text = ""
-    if target_path.exists():
-        try:
-            old_text = target_path.read_text(encoding="utf-8")
-        except Exception:
-            old_text = ""
-
-    old_lines = old_text.splitlines(keepends=True)
-    new_lines = (new_content or "").splitlines(keepends=True)
-
-    diff_lines = list(
-        difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=str(target_path),
-            tofile=title_new,
-            lineterm="",
+    old_text = _read_dest_text(target_path)
+
+    new_text = new_content or ""
+
+    if not old_text:
+        # New (or empty) destination: every line is an addition, no matching to do.
+        new_lines = new_text.splitlines()
+        if not new_lines:
+            return _report_no_line_changes(target_path, old_text, new_text)
+        n = len(new_lines)
+        _removed, added, reset = _DIFF_MARKS_COLORED
+        GLOBAL_CONSOLE.print(f"--- Diff: {target_path} ---")
+        _write_diff_payload(_encode_diff_lines([
+            f"--- {target_path}",
+            f"+++ {title_new}",
+            "@@ -0,0 +1 @@" if n == 1 else f"@@ -0,0 +1,{n} @@",
+            *(added + line + reset for line in new_lines),
+        ]))
+        return True
+
+    if (
+        len(old_text) > _DIFF_SUMMARY_MIN_CHARS
+        and abs(len(new_text) - len(old_text)) * 2 > len(old_text)
+    ):
+        # Large file rewritten wholesale: a line diff would be both slow and unreadable.
+        old_n = old_text.count("\n")
+        new_n = new_text.count("\n")
+        GLOBAL_CONSOLE.print(f"--- Diff: {target_path} ---")
+        GLOBAL_CONSOLE.print(
+            f"Large rewrite, line diff skipped: {old_n} -> {new_n} lines, "
+            f"{len(old_text)} -> {len(new_text)} chars."
         )
-    )
+        return True
+
+    # Rendered diffs are memoized on (destination, its mtime, title, new content):
+    # re-reviewing the same artifact folder skips difflib entirely.
+    dest_entry = _DEST_READ_CACHE.get(target_path)
+    cache_key = None
+    if dest_entry is not None:
+        digest = _content_digest(new_text)
+        cache_key = (target_path, dest_entry[0], title_new, digest)
+        if cache_key in _DIFF_CACHE:
+            payload = _DIFF_CACHE[cache_key]
+            if payload is None:
+                return _report_no_line_changes(target_path, old_text, new_text)
+            GLOBAL_CONSOLE.print(f"--- Diff: {target_path} ---")
+            _write_diff_payload(payload)
+            return True
 
-    if not diff_lines:
-        GLOBAL_CONSOLE.print(f"No changes for: {target_path}")
-        return False
+    # Generator, consumed once; no keepends, so every output line is newline-free.
+    diff_iter = _unified_diff(
+        old_text.splitlines(),
+        new_text.splitlines(),
+        fromfile=str(target_path),
+        tofile=title_new,
+        marks=_DIFF_MARKS_COLORED,
+    )
 
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    RESET = "\033[0m"
+    first = next(diff_iter, None)
+    if first is None:
+        _remember_diff(cache_key, None)
+        return _report_no_line_changes(target_path, old_text, new_text)
 
+    payload = _encode_diff_lines(diff_iter, first)
+    _remember_diff(cache_key, payload)
     GLOBAL_CONSOLE.print(f"--- Diff: {target_path} ---")
-    for line in diff_lines:
-        if line.startswith("+++") or line.startswith("---") or line.startswith("@@"):
-            print(line)
+    _write_diff_payload(payload)
+
+    return True
+
+
+def _report_no_line_changes(target_path: Path, old_text: str, new_text: str) -> bool:
+    """Empty line diff: splitlines() hides CRLF/LF and final-newline changes,
+    so say so explicitly rather than "No changes" when the bytes still differ."""
+    if old_text != new_text:
+        GLOBAL_CONSOLE.print(f"Only line endings / end-of-file newline differ for: {target_path}")
+        return True
+    GLOBAL_CONSOLE.print(f"No changes for: {target_path}")
+    return False
+
+
+def _content_digest(text: str) -> bytes:
+    """128-bit digest of text for local cache keys (no cryptographic need):
+    xxh3 when xxhash is installed, BLAKE2b otherwise."""
+    data = text.encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    # Same as difflib._format_range_unified.
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _unified_diff(
+    a: list[str],
+    b: list[str],
+    fromfile: str,
+    tofile: str,
+    n: int = 3,
+    marks: tuple[str, str, str] = _DIFF_MARKS_PLAIN,
+):
+    """difflib.unified_diff(a, b, fromfile, tofile, n=n, lineterm="") output,
+    computed with cdifflib's CSequenceMatcher when it is installed.
+
+    marks: (removed prefix, added prefix, suffix) for body lines; the default
+    gives difflib's exact output, _DIFF_MARKS_COLORED the terminal rendering.
+    """
+    removed, added, suffix = marks
+    if CSequenceMatcher is not None:
+        matcher = CSequenceMatcher(None, a, b)
+    else:
+        import difflib  # only needed when a real line diff is computed
+
+        matcher = difflib.SequenceMatcher(None, a, b)
+
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range_unified(first[1], last[2])} +{_format_range_unified(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield removed + line + suffix
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield added + line + suffix
+
+
+def _remember_diff(key: tuple | None, payload: bytes | None) -> None:
+    if key is None:
+        return
+    if len(_DIFF_CACHE) >= _DIFF_CACHE_MAX:
+        _DIFF_CACHE.pop(next(iter(_DIFF_CACHE)))  # oldest entry (insertion order)
+    _DIFF_CACHE[key] = payload
+
+
+def _encode_diff_lines(lines, first: str | None = None) -> bytes:
+    """Join already-rendered diff lines (newline-terminated) and encode them once."""
+    encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+    head = () if first is None else (first,)
+    return "\n".join(itertools.chain(head, lines, ("",))).encode(encoding, "replace")
+
+
+def _write_diff_payload(payload: bytes) -> None:
+    """Write a rendered diff to stdout in a single write."""
+    out = sys.stdout
+    raw = getattr(out, "buffer", None)
+    if raw is None:
+        # Text-only stream (captured/redirected stdout).
+        out.write(payload.decode(getattr(out, "encoding", None) or "utf-8", "replace"))
+        out.flush()
+    else:
+        out.flush()  # the diff title (text layer) must land before the raw bytes
+        raw.write(payload)
+        raw.flush()
+
+
+# Directories never deployed from an artifact folder.
+_ARTIFACT_SKIP_DIRS = {".git", "__pycache__"}
+
+
+def _iter_artifact_files(artifact_folder: Path):
+    """Yield deployable file paths (str) under artifact_folder (unordered).
+
+    Internal technical files (.meta.json sidecars, raw_response_trace.jsonl) are
+    filtered on the directory entry name; d_type from scandir avoids a stat per
+    entry. Callers sort the plain strings once and build Path objects afterwards.
+    """
+    stack = [str(artifact_folder)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _ARTIFACT_SKIP_DIRS:
+                        stack.append(entry.path)
+                    continue
+                if name.endswith(".meta.json") or name == "raw_response_trace.jsonl":
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    yield entry.path
 
-        if line.startswith("+"):
-            print(f"{GREEN}{line}{RESET}")
-        elif line.startswith("-"):
-            print(f"{RED}{line}{RESET}")
-        else:
-            print(line)
 
-    return True
+# Review prompt answers (already stripped/lowercased).
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no", "abort"})
+_ALL = frozenset({"a", "all", "apply-all"})
+
 
+def review_and_apply(artifact_folder: str | Path, commit_message: str) -> tuple[bool, list[Path]]:
+    """Interactive review of artifacts with atomic accept-all rule.
 
-def review_and_apply(artifact_folder: str | Path, commit_message: str) -> bool:
-    """Interactive review of artifacts with atomic accept-all rule."""
+    Returns (accepted, artifact_files): the sorted file list is handed to
+    smart_deploy_and_commit so the folder is only walked once.
+    """
     artifact_folder = Path(artifact_folder)
     if not artifact_folder.exists():
         GLOBAL_CONSOLE.error(f"Artifact folder not found: {artifact_folder}")
-        return False
+        return False, []
 
     project_root = GLOBAL_CONFIG.project_root
 
-    all_files = [p for p in artifact_folder.rglob("*") if p.is_file()]
-
     # On exclut les fichiers .meta.json et les traces brutes
-    artifact_files = [
-        p for p in all_files
-        if not p.name.endswith(".meta.json")
-        and p.name != "raw_response_trace.jsonl"
-    ]
-    artifact_files.sort(key=lambda p: str(p))
+    artifact_files = [Path(p) for p in sorted(_iter_artifact_files(artifact_folder))]
 
     if not artifact_files:
         GLOBAL_CONSOLE.print("No artifact files to review.")
-        return False
+        return False, []
 
     GLOBAL_CONSOLE.print(f"Reviewing {len(artifact_files)} artifact file(s) from: {artifact_folder}")
 
-    for artifact_path in artifact_files:
+    for index, artifact_path in enumerate(artifact_files):
         rel = artifact_path.relative_to(artifact_folder)
-        dest_path = (project_root / rel).resolve()
+        # project_root is already resolved (config); normpath is a pure string op.
+        dest_path = Path(os.path.normpath(project_root / rel))
 
         try:
             rel_dest_path = str(dest_path.relative_to(project_root))
@@ -227,62 +583,97 @@ def review_and_apply(artifact_folder: str | Path, commit_message: str) -> bool:
             rel_dest_path = str(dest_path)
 
         try:
-            new_content = artifact_path.read_text(encoding="utf-8")
+            with open(artifact_path, "r", encoding="utf-8", newline="") as f:
+                new_content = f.read()
         except Exception as e:
             GLOBAL_CONSOLE.error(f"Cannot read artifact file {artifact_path}: {e}")
-            return False
+            return False, []
 
         _ = show_diff(dest_path, new_content, title_new="Artifact (New)")
 
         while True:
-            ans = GLOBAL_CONSOLE.input(f"[{rel_dest_path}] Apply this change? [y/n/abort]: ").strip().lower()
-            if ans in {"y", "yes"}:
+            ans = GLOBAL_CONSOLE.input(f"[{rel_dest_path}] Apply this change? [y/n/a(ll)/abort]: ").strip().lower()
+            if ans in _YES:
                 break
-            if ans in {"n", "no", "abort"}:
+            if ans in _ALL:
+                # Accept this file and every remaining one without further prompts.
+                remaining = len(artifact_files) - index - 1
+                if remaining:
+                    GLOBAL_CONSOLE.print(f"Applying the {remaining} remaining file(s) without review.")
+                return True, artifact_files
+            if ans in _NO:
                 GLOBAL_CONSOLE.print("Aborted: No changes were applied.")
-                return False
-            GLOBAL_CONSOLE.print("Please answer with 'y', 'n', or 'abort'.")
+                return False, []
+            GLOBAL_CONSOLE.print("Please answer with 'y', 'n', 'a', or 'abort'.")
 
-    return True
+    return True, artifact_files
+
+
+def _git_last_commit(cwd: str | None = None) -> tuple[int, tuple[str, str, str, str] | None, str]:
+    """Query HEAD with a single `git log -1` call.
+
+    Returns:
+      (returncode, (sha, short_sha, relative_date, subject) or None, stderr)
+    """
+    proc = subprocess.run(
+        ["git", "log", "-1", "--format=%H%x09%h%x09%cr%x09%s"],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    )
+    if proc.returncode != 0:
+        return proc.returncode, None, (proc.stderr or "")
 
+    parts = (proc.stdout or "").rstrip("\n").split("\t", 3)
+    if len(parts) != 4 or not parts[0]:
+        return proc.returncode, None, (proc.stderr or "")
+    return proc.returncode, (parts[0], parts[1], parts[2], parts[3]), (proc.stderr or "")
 
-def _cmd_status() -> None:
-    """Print repository status information using git."""
+
+def _cmd_status() -> str | None:
+    """Print repository status information using git.
+
+    Returns the HEAD commit SHA (full) when available, else None.
+    """
     GLOBAL_CONSOLE.print("--- Repository Status ---")
 
     try:
-        proc1 = subprocess.run(["git", "status", "-s"], capture_output=True, text=True, check=False)
+        proc1 = subprocess.Popen(
+            ["git", "status", "-s"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
     except FileNotFoundError:
         GLOBAL_CONSOLE.error("Git status is unavailable. Ensure 'git' is installed and you are inside a git repository.")
-        return
+        return None
+
+    # The two queries are independent: read HEAD while `git status` runs.
+    rc2, head, err2 = _git_last_commit()
+    out1, err1 = proc1.communicate()
 
     if proc1.returncode != 0:
         GLOBAL_CONSOLE.error("Git status is unavailable. Ensure 'git' is installed and you are inside a git repository.")
-        if (proc1.stderr or "").strip():
-            GLOBAL_CONSOLE.error(f"Details: {(proc1.stderr or '').strip()}")
-        return
+        if (err1 or "").strip():
+            GLOBAL_CONSOLE.error(f"Details: {(err1 or '').strip()}")
+        return None
 
-    out1 = (proc1.stdout or "").rstrip("\n")
+    out1 = (out1 or "").rstrip("\n")
     if out1.strip():
         GLOBAL_CONSOLE.print(out1)
     else:
         GLOBAL_CONSOLE.print("Working tree clean.")
 
-    proc2 = subprocess.run(
-        ["git", "log", "-1", "--format=%h - %s (%cr)"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if proc2.returncode != 0:
+    if rc2 != 0:
         GLOBAL_CONSOLE.error("Git log is unavailable. Ensure this repository has commits and git is working correctly.")
-        if (proc2.stderr or "").strip():
-            GLOBAL_CONSOLE.error(f"Details: {(proc2.stderr or '').strip()}")
-        return
+        if err2.strip():
+            GLOBAL_CONSOLE.error(f"Details: {err2.strip()}")
+        return None
+
+    if head is None:
+        return None
 
-    out2 = (proc2.stdout or "").strip()
-    if out2:
-        GLOBAL_CONSOLE.print(out2)
+    sha, short_sha, rel_date, subject = head
+    GLOBAL_CONSOLE.print(f"{short_sha} - {subject} ({rel_date})")
+    return sha
 
 
 def _estimate_cost_usd(usage_stats: dict) -> tuple[float, float, float]:
@@ -300,15 +691,21 @@ def _estimate_cost_usd(usage_stats: dict) -> tuple[float, float, float]:
 
 
 def _format_int(n: int) -> str:
-    try:
+    if isinstance(n, int):
+        return f"{n:,}"
+    if isinstance(n, float) and math.isfinite(n):
         return f"{int(n):,}"
-    except Exception:
-        return str(n)
+    if isinstance(n, str):
+        s = n.strip()
+        digits = s[1:] if s[:1] in ("-", "+") else s
+        if digits.isdecimal():
+            return f"{int(s):,}"
+    return str(n)
 
 
 def _cmd_report() -> None:
     """Display a clean financial & operational dashboard based on audit_log.jsonl."""
-    report = GLOBAL_LEDGER.generate_report("all")
+    report = GLOBAL_LEDGER.generate_report_incremental()
 
     total_tx = int(report.get("total_requests", 0) or 0)
     in_tok = int(report.get("total_input_tokens", 0) or 0)
@@ -323,6 +720,7 @@ def _cmd_report() -> None:
     GLOBAL_CONSOLE.print(f"Ledger File: {ledger_file}")
 
 
+@functools.lru_cache(maxsize=128)
 def _normalize_exec_script_arg(raw: str) -> str:
     """Normalize the user-provided exec script argument."""
     s = (raw or "").strip()
@@ -364,23 +762,184 @@ def _cmd_exec(tokens: list[str]) -> None:
         GLOBAL_CONSOLE.error(f"Workbench exec blocked/failed: {e}")
         return
 
-    GLOBAL_CONSOLE.print("--- Workbench Exec ---")
-    GLOBAL_CONSOLE.print(f"Script: workbench/scripts/{rel_script}")
+    block = ["--- Workbench Exec ---", f"Script: workbench/scripts/{rel_script}"]
     if script_args:
-        GLOBAL_CONSOLE.print(f"Args: {' '.join(script_args)}")
-    GLOBAL_CONSOLE.print(f"Return code: {rc}")
+        block.append(f"Args: {' '.join(script_args)}")
+    block.append(f"Return code: {rc}")
 
     if (out or "").strip():
-        GLOBAL_CONSOLE.print("[STDOUT]")
-        GLOBAL_CONSOLE.print(out.rstrip("\n"))
+        block += ["[STDOUT]", out.rstrip("\n")]
     else:
-        GLOBAL_CONSOLE.print("[STDOUT] (empty)")
+        block.append("[STDOUT] (empty)")
 
     if (err or "").strip():
-        GLOBAL_CONSOLE.print("[STDERR]")
-        GLOBAL_CONSOLE.print(err.rstrip("\n"))
+        block += ["[STDERR]", err.rstrip("\n")]
     else:
-        GLOBAL_CONSOLE.print("[STDERR] (empty)")
+        block.append("[STDERR] (empty)")
+
+    GLOBAL_CONSOLE.write_block(block)
+
+
+# Prompts file for `batch`: prompts separated by lines containing only "---".
+_BATCH_SEPARATOR = "---"
+_BATCH_DEFAULT_JOBS = 4
+
+# `batch --group K`: K prompts share one request. Appended to the architect system
+# prompt; each entry of responses_by_id is a normal single-request response.
+_BATCH_GROUP_INSTRUCTIONS = """
+
+BATCHED REQUESTS:
+The user message holds several independent requests as JSON: {"requests": [{"id": "r1", "ask": "..."}, ...]}.
+Handle each request on its own, as if it had been sent alone (same RESPONSE FORMAT, no next_action).
+Reply with ONE JSON object keyed by request id:
+{"responses_by_id": {"r1": {"thought_process": "...", "artifacts": [...]}, "r2": {...}}}
+"""
+
+
+def _read_batch_prompts(path: str) -> list[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    prompts: list[str] = []
+    current: list[str] = []
+    for line in text.splitlines():
+        if line.strip() == _BATCH_SEPARATOR:
+            prompts.append("\n".join(current).strip())
+            current = []
+        else:
+            current.append(line)
+    prompts.append("\n".join(current).strip())
+    return [p for p in prompts if p]
+
+
+def _grouped_user_prompt(prompts: list[str], project_context: str) -> str:
+    requests = [{"id": f"r{i}", "ask": p} for i, p in enumerate(prompts, start=1)]
+    return json.dumps({"requests": requests}, ensure_ascii=False, indent=2) + "\n\n" + project_context
+
+
+def _split_grouped_response(raw_text: str, count: int) -> list[str | None]:
+    """Demultiplex a grouped answer into one raw response per request (None if missing)."""
+    text = raw_text or ""
+    try:
+        doc = json.loads(text)
+    except ValueError:
+        start = text.find("{")
+        try:
+            doc = json.JSONDecoder().raw_decode(text, start)[0] if start >= 0 else {}
+        except ValueError:
+            doc = {}
+    by_id = doc.get("responses_by_id") if isinstance(doc, dict) else None
+    if not isinstance(by_id, dict):
+        by_id = {}
+    out: list[str | None] = []
+    for i in range(1, count + 1):
+        sub = by_id.get(f"r{i}")
+        out.append(json.dumps(sub, ensure_ascii=False) if isinstance(sub, dict) else None)
+    return out
+
+
+def _cmd_batch(tokens: list[str], client: "AIClient") -> None:
+    """Send several independent prompts concurrently and write their artifacts.
+
+    Usage: batch <prompts_file> [--scope ...] [-j N] [--group K]
+
+    The project context is built once and shared by every prompt. Requests run on
+    N worker threads (the API wait dominates); responses are then processed in
+    file order on the main thread. No review, deploy or commit: each prompt only
+    produces its artifacts/<step_id>/ folder. Rebound (next_action) is not run.
+
+    --group K packs K prompts into one request (one round trip and one copy of the
+    context for K prompts); the answer is split back per prompt by request id.
+    """
+    from src.artifact_manager import GLOBAL_ARTIFACTS
+
+    if len(tokens) < 2:
+        GLOBAL_CONSOLE.error(
+            f"Usage: batch <prompts_file> [--scope ...] [-j N] [--group K] (prompts separated by '{_BATCH_SEPARATOR}' lines)"
+        )
+        return
+
+    jobs = _BATCH_DEFAULT_JOBS
+    group = 1
+    for i, t in enumerate(tokens[2:], start=2):
+        if t in ("-j", "--jobs", "--group") and i + 1 < len(tokens):
+            try:
+                value = max(1, int(tokens[i + 1]))
+            except ValueError:
+                GLOBAL_CONSOLE.error(f"Invalid value for {t}: {tokens[i + 1]}")
+                return
+            if t == "--group":
+                group = value
+            else:
+                jobs = value
+    _files, scope = _parse_impl_flags(tokens, start=2)
+
+    try:
+        prompts = _read_batch_prompts(tokens[1])
+    except Exception as e:
+        GLOBAL_CONSOLE.error(f"Cannot read prompts file {tokens[1]}: {e}")
+        return
+    if not prompts:
+        GLOBAL_CONSOLE.error("No prompt found in the batch file.")
+        return
+
+    session_id = datetime.now().strftime("%Y-%m-%d")
+    project_context, ctx_summary = GLOBAL_CONTEXT.build_context_with_summary(scope=scope)
+    GLOBAL_CONSOLE.print(ctx_summary)
+
+    n = len(prompts)
+    groups = [prompts[i : i + group] for i in range(0, n, group)]
+    workers = min(jobs, len(groups))
+    GLOBAL_CONSOLE.print(f"Sending {n} prompt(s) in {len(groups)} request(s), {workers} at a time...")
+
+    def send(chunk: list[str]):
+        if len(chunk) == 1:
+            return client.send_chat_request(SYSTEM_PROMPT_ARCHITECT, f"{chunk[0]}\n\n{project_context}")
+        return client.send_chat_request(
+            SYSTEM_PROMPT_ARCHITECT + _BATCH_GROUP_INSTRUCTIONS, _grouped_user_prompt(chunk, project_context)
+        )
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+        futures = [pool.submit(send, chunk) for chunk in groups]
+        idx = 0
+        for chunk, fut in zip(groups, futures):
+            try:
+                json_response, usage_stats = fut.result()
+                error = None
+            except Exception as e:
+                json_response, usage_stats, error = None, {}, e
+
+            if error is None:
+                GLOBAL_CONSOLE.write_block(["[AI_RESPONSE_BEGIN]", json_response or "", "[AI_RESPONSE_END]"])
+            responses = [json_response] if len(chunk) == 1 else _split_grouped_response(json_response, len(chunk))
+
+            for prompt, raw in zip(chunk, responses):
+                idx += 1
+                first_line = prompt.splitlines()[0][:60]
+                if error is not None:
+                    GLOBAL_CONSOLE.error(f"[batch {idx}/{n}] {first_line}: request failed: {error}")
+                    continue
+                if raw is None:
+                    GLOBAL_CONSOLE.error(f"[batch {idx}/{n}] {first_line}: no answer for this prompt in the grouped response")
+                    continue
+
+                step_id = _generate_step_id()
+                # One bad response (malformed JSON fields, disk error) must not end
+                # the REPL nor drop the remaining, already paid-for, responses.
+                try:
+                    files = GLOBAL_ARTIFACTS.process_response(session_id="current", step_name=step_id, raw_text=raw)
+                    GLOBAL_CONSOLE.print(f"[batch {idx}/{n}] {first_line}: {len(files or [])} file(s) in artifacts/{step_id}/")
+                    GLOBAL_LEDGER.log_transaction(
+                        session_id=session_id,
+                        user_instruction=prompt,
+                        step_id=step_id,
+                        usage_stats=usage_stats,
+                        status="batch_generated",
+                    )
+                    usage_stats = {}  # a shared (grouped) request is counted once
+                except Exception as e:
+                    GLOBAL_CONSOLE.error(f"[batch {idx}/{n}] {first_line}: failed: {e}")
+
+    _MANIFEST_POOL.submit(_generate_and_report_manifest, session_id)
 
 
 def _print_help():
@@ -394,6 +953,10 @@ def _print_help():
     GLOBAL_CONSOLE.print(
         "  exec <script.py> [args...] - Execute a Python script located in workbench/scripts/ (restricted sandbox)"
     )
+    GLOBAL_CONSOLE.print(
+        "  batch <file> [--scope ...] [-j N] [--group K] - Send the prompts of <file> ('---'-separated) concurrently; artifacts only, no review/commit"
+    )
+    GLOBAL_CONSOLE.print("                         --group K: K prompts per request (one round trip for K prompts)")
     GLOBAL_CONSOLE.print("  test_ai              - Send a minimal test request to the AI")
     GLOBAL_CONSOLE.print("  status               - Show git working tree status and last commit")
     GLOBAL_CONSOLE.print("  report               - Show aggregated tokens and estimated cost (from audit_log.jsonl)")
@@ -416,50 +979,53 @@ def _print_help():
     GLOBAL_CONSOLE.print("    - Only .py allowed; timeout=60s")
 
 
-def _extract_attached_files(tokens: list[str]) -> list[str]:
-    attached: list[str] = []
-    i = 0
-    while i < len(tokens):
-        t = tokens[i]
-        if t in {"-f", "--file"}:
-            if i + 1 < len(tokens):
-                attached.append(tokens[i + 1])
-                i += 2
-                continue
-            attached.append("")
-            i += 1
-            continue
-        i += 1
-    return [p for p in attached if p]
+def _fast_tokens(line: str) -> list[str]:
+    """shlex.split, with a str.split fast path when there is no quote/escape to honour."""
+    if '"' in line or "'" in line or "\\" in line:
+        return shlex.split(line)
+    return line.split()
 
 
-def _extract_scope(tokens: list[str]) -> str:
-    scope = "full"
-    allowed = {"full", "code", "specs", "minimal"}
+_SCOPES = frozenset({"full", "code", "specs", "minimal"})
+
+
+def _parse_impl_flags(tokens: list[str], start: int = 0) -> tuple[list[str], str]:
+    """Single pass over tokens[start:] for `-f/--file <path>` and `--scope[=]<val>`.
 
-    i = 0
-    while i < len(tokens):
+    Returns (attached_files, scope). Unknown scope values are ignored (default: full).
+    """
+    attached: list[str] = []
+    scope = "full"
+    n = len(tokens)
+    i = start
+    while i < n:
         t = tokens[i]
-        if t.startswith("--scope="):
-            val = t.split("=", 1)[1].strip().lower()
-            if val in allowed:
-                scope = val
-            i += 1
+        if t == "-f" or t == "--file":
+            if i + 1 < n and tokens[i + 1]:
+                attached.append(tokens[i + 1])
+            i += 2
             continue
 
         if t == "--scope":
-            if i + 1 < len(tokens):
+            if i + 1 < n:
                 val = (tokens[i + 1] or "").strip().lower()
-                if val in allowed:
+                if val in _SCOPES:
                     scope = val
-                i += 2
-                continue
-            i += 1
+            i += 2
             continue
 
+        if t.startswith("--scope="):
+            val = t[8:].strip().lower()
+            if val in _SCOPES:
+                scope = val
+
         i += 1
 
-    return scope
+    return attached, scope
+
+
+def _read_attached_file(fp: str) -> str:
+    return Path(fp).read_text(encoding="utf-8", errors="replace")
 
 
 def _build_adhoc_file_injection(file_paths: list[str]) -> tuple[str, list[str], bool]:
@@ -469,82 +1035,126 @@ def _build_adhoc_file_injection(file_paths: list[str]) -> tuple[str, list[str],
     injection_parts: list[str] = []
     attached_names: list[str] = []
 
-    for fp in file_paths:
-        p = Path(fp)
-        try:
-            content = p.read_text(encoding="utf-8", errors="replace")
-        except FileNotFoundError:
-            GLOBAL_CONSOLE.error(f"Attached file not found: {fp}")
-            return "", attached_names, False
-        except PermissionError as e:
-            GLOBAL_CONSOLE.error(f"Permission error reading attached file '{fp}': {e}")
-            return "", attached_names, False
-        except Exception as e:
-            GLOBAL_CONSOLE.error(f"Failed to read attached file '{fp}': {e}")
-            return "", attached_names, False
+    # Reads are independent: run them concurrently, consume results in input order,
+    # and drop the reads still queued as soon as one file fails.
+    pool = ThreadPoolExecutor(max_workers=min(8, len(file_paths)))
+    try:
+        contents = pool.map(_read_attached_file, file_paths)
 
-        attached_names.append(str(fp))
-        GLOBAL_CONSOLE.print(f"📎 Attached: {p.name}")
+        for fp in file_paths:
+            p = Path(fp)
+            try:
+                content = next(contents)
+            except FileNotFoundError:
+                GLOBAL_CONSOLE.error(f"Attached file not found: {fp}")
+                return "", attached_names, False
+            except PermissionError as e:
+                GLOBAL_CONSOLE.error(f"Permission error reading attached file '{fp}': {e}")
+                return "", attached_names, False
+            except Exception as e:
+                GLOBAL_CONSOLE.error(f"Failed to read attached file '{fp}': {e}")
+                return "", attached_names, False
 
-        injection_parts.append(f"\n\n--- ATTACHED FILE: {fp} ---\n{content}\n")
+            attached_names.append(str(fp))
+            GLOBAL_CONSOLE.print(f"📎 Attached: {p.name}")
+
+            injection_parts.append(f"\n\n--- ATTACHED FILE: {fp} ---\n{content}\n")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     return "".join(injection_parts), attached_names, True
 
 
+# Step-id suffix: random start (distinct across processes), then incremented,
+# so two steps of the same session never collide even within one second.
+_STEP_COUNTER = itertools.count(int.from_bytes(os.urandom(2), "big"))
+
+
 def _generate_step_id(now: datetime | None = None) -> str:
-    dt = now or datetime.now()
-    timestamp = dt.strftime("%Y%m%d_%H%M%S")
-    short_id = uuid.uuid4().hex[:4]
-    return f"step_{timestamp}_{short_id}"
+    timestamp = time.strftime("%Y%m%d_%H%M%S", now.timetuple() if now else time.localtime())
+    return f"step_{timestamp}_{next(_STEP_COUNTER) & 0xFFFF:04x}"
 
 
 def _trinity_protocol_consistency_check(generated_artifacts: list[str]) -> None:
     if not generated_artifacts:
         return
 
-    norm = []
+    # Bit flags: 1 = src, 2 = impl-docs, 4 = specs. A leading "/" lets a single
+    # substring test match both "src/..." and ".../src/...".
+    flags = 0
     for p in generated_artifacts:
         if not p:
             continue
-        s = str(p).replace("\\", "/")
-        norm.append(s)
-
-    has_src = any("/src/" in p or p.startswith("src/") for p in norm)
-    if not has_src:
-        return
-
-    has_impl_docs = any("/impl-docs/" in p or p.startswith("impl-docs/") for p in norm)
-    has_specs = any("/specs/" in p or p.startswith("specs/") for p in norm)
+        s = "/" + (p if isinstance(p, str) else str(p)).replace("\\", "/")
+        if "/src/" in s:
+            flags |= 1
+        if "/impl-docs/" in s:
+            flags |= 2
+        if "/specs/" in s:
+            flags |= 4
+        if flags == 7:
+            return
 
-    if has_src and (not has_impl_docs or not has_specs):
+    has_src = flags & 1
+    if has_src and (not flags & 2 or not flags & 4):
         print("⚠️  TRINITY PROTOCOL WARNING")
         print("--------------------------")
         print("Code changes detected, but Specs/Docs were not updated in this session.")
         print("Please verify alignment manually or ask for a retrofit.")
 
 
+def _read_head_sha_from_git_dir(cwd: str) -> str | None:
+    """Resolve HEAD by reading .git directly (no git process).
+
+    Returns None for layouts this does not handle (worktree/submodule .git file,
+    missing ref, ...) so the caller can fall back to `git log`.
+    """
+    git_dir = Path(cwd) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):
+        sha = head  # detached HEAD
+    else:
+        ref = head[5:]
+        try:
+            sha = (git_dir / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            sha = ""
+            try:
+                with open(git_dir / "packed-refs", "r", encoding="utf-8") as f:
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) == 2 and parts[1] == ref:
+                            sha = parts[0]
+                            break
+            except OSError:
+                return None
+
+    if len(sha) in (40, 64) and all(c in "0123456789abcdef" for c in sha):
+        return sha
+    return None
+
+
 def _get_head_commit_sha(cwd: str) -> str | None:
     """Return current HEAD commit SHA (full) or None if unavailable."""
+    sha = _read_head_sha_from_git_dir(cwd)
+    if sha:
+        return sha
+
     try:
-        proc = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=cwd,
-        )
+        _rc, head, _err = _git_last_commit(cwd)
     except FileNotFoundError:
         return None
     except Exception:
         return None
 
-    if proc.returncode != 0:
-        return None
-
-    sha = (proc.stdout or "").strip()
-    return sha or None
+    return head[0] if head else None
 
 
+@functools.lru_cache(maxsize=128)
 def _validate_next_action_target(target_script: str) -> tuple[bool, str, str]:
     """Validate next_action target_script.
 
@@ -582,11 +1192,15 @@ def _validate_next_action_target(target_script: str) -> tuple[bool, str, str]:
 def smart_deploy_and_commit(
     artifact_folder: Path,
     user_instruction: str,
-    client: AIClient,
+    client: "AIClient",
     hot_deployed_files: list[Path] | None = None,
+    artifact_files: list[Path] | None = None,
 ) -> bool:
     """Centralized Smart Deploy & Commit pipeline.
 
+    artifact_files: the sorted list already enumerated by review_and_apply
+    (the folder is walked again only when it is not provided).
+
     Logic:
     1. Copy ALL files from artifact_folder to project root (no filter).
     2. GIT ADD filter: Only add files in allowed paths (src/, specs/, impl-docs/, workbench/scripts/).
@@ -602,24 +1216,73 @@ def smart_deploy_and_commit(
         GLOBAL_CONSOLE.error(f"Artifact folder not found: {artifact_folder}")
         return False
 
-    all_files = [p for p in artifact_folder.rglob("*") if p.is_file()]
     # Filter out internal technical artifacts for copy
-    deployable_files = [
-        p for p in all_files
-        if not p.name.endswith(".meta.json")
-        and p.name != "raw_response_trace.jsonl"
-    ]
+    if artifact_files is None:
+        deployable_files = [Path(p) for p in sorted(_iter_artifact_files(artifact_folder))]
+    else:
+        deployable_files = artifact_files
 
     # 1. Copy ALL valid files (Sans Filtre for copy)
-    for artifact_path in deployable_files:
-        rel = artifact_path.relative_to(artifact_folder)
-        dest_path = (project_root / rel).resolve()
-        try:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(artifact_path, dest_path)
-        except Exception as e:
-            GLOBAL_CONSOLE.error(f"Failed to copy {rel}: {e}")
-            return False
+    # Stage every file next to its destination first (unique mkstemp name, the
+    # destination's mode bits), then swap them in with os.replace (atomic on the
+    # same filesystem). A failure or Ctrl-C while staging leaves the project tree
+    # untouched instead of half-applied.
+    # Destinations already identical to their artifact are left alone (no
+    # write, mtime kept, so git and the diff caches see them as untouched).
+    staged: list[tuple[Path, Path]] = []
+    sources: list[Path] = []
+    try:
+        created_dirs: set[Path] = set()
+        for artifact_path in deployable_files:
+            rel = artifact_path.relative_to(artifact_folder)
+            dest_path = Path(os.path.normpath(project_root / rel))
+            if dest_path.is_symlink():
+                # Write through the link (os.replace on the link itself would turn
+                # it into a regular file).
+                _DEST_READ_CACHE.pop(dest_path, None)
+                dest_path = dest_path.resolve()
+            if _same_file_content(artifact_path, dest_path):
+                continue
+            try:
+                if dest_path.parent not in created_dirs:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest_path.parent)
+                tmp_path = _stage_path(dest_path)
+            except Exception as e:
+                GLOBAL_CONSOLE.error(f"Failed to copy {rel}: {e}")
+                return False
+            staged.append((tmp_path, dest_path))
+            sources.append(artifact_path)
+
+        # Copies are independent: run them concurrently, report failures in order.
+        if staged:
+            with ThreadPoolExecutor(max_workers=min(8, len(staged))) as pool:
+                futures = [
+                    pool.submit(_fast_copy, artifact_path, tmp_path)
+                    for artifact_path, (tmp_path, _dest_path) in zip(sources, staged)
+                ]
+                for artifact_path, fut in zip(sources, futures):
+                    try:
+                        fut.result()
+                    except Exception as e:
+                        for f in futures:
+                            f.cancel()
+                        GLOBAL_CONSOLE.error(f"Failed to copy {artifact_path.relative_to(artifact_folder)}: {e}")
+                        return False
+
+        for tmp_path, dest_path in staged:
+            try:
+                os.replace(tmp_path, dest_path)
+            except Exception as e:
+                GLOBAL_CONSOLE.error(f"Failed to apply {dest_path}: {e}")
+                return False
+            _DEST_READ_CACHE.pop(dest_path, None)
+    finally:
+        for tmp_path, _dest_path in staged:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
     # 2. GIT ADD Filter
     files_to_commit: list[str] = []
@@ -651,35 +1314,35 @@ def smart_deploy_and_commit(
             allow = True
 
         if allow:
-            dest_path = project_root / rel
-            try:
-                subprocess.run(
-                    ["git", "add", "-f", str(dest_path)],
-                    cwd=str(project_root),
-                    check=False,
-                )
-                files_to_commit.append(str(dest_path))
-            except Exception as e:
-                GLOBAL_CONSOLE.error(f"Git add failed for {rel}: {e}")
+            files_to_commit.append(str(project_root / rel))
 
     # 3. Force Add Hot-Deployed Files
     if hot_deployed_files:
         for p in hot_deployed_files:
             if p.exists():
-                try:
-                    subprocess.run(
-                        ["git", "add", "-f", str(p)],
-                        cwd=str(project_root),
-                        check=False,
-                    )
-                    files_to_commit.append(str(p))
-                except Exception:
-                    pass
+                files_to_commit.append(str(p))
 
+    # One `git add -f` for the whole set instead of one process per file.
+    files_to_commit = list(dict.fromkeys(files_to_commit))
     if not files_to_commit:
         GLOBAL_CONSOLE.print("No files matched the allowed paths for git tracking.")
         return False
 
+    if not git_add_force_tracked_paths(files_to_commit, cwd=str(project_root)):
+        # One bad path fails the whole batched call: retry per path to find it, and
+        # stop rather than commit (or report "nothing to commit") a partial set.
+        failed = [p for p in files_to_commit if not git_run_ok(["add", "-f", "--", p], cwd=str(project_root))]
+        if failed:
+            for p in failed:
+                GLOBAL_CONSOLE.error(f"Git add failed for {p}")
+            return False
+
+    # Staged content identical to HEAD: skip the summary script, the AI commit
+    # message and the commit/push round-trips (REQ_CORE_080 "nothing to commit").
+    if not git_has_staged_changes(cwd=str(project_root)):
+        GLOBAL_CONSOLE.print("ℹ️  Git: Nothing to commit. Proceeding...")
+        return True
+
     # 4. Audit Summary
     runner = WorkbenchRunner(project_root=project_root, timeout_s=30)
     summary_script = "git_pre_commit_summary.py"
@@ -727,7 +1390,7 @@ def smart_deploy_and_commit(
         return False
 
 
-def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
+def _run_prompt_flow(tokens: list[str], client: "AIClient") -> None:
     """Run the main AI prompt -> artifacts -> (optional rebound loop) -> review/apply -> git -> audit flow.
 
     Implements specs/10_autonomous_rebound_protocol.md (REQ_AUTO_010..050).
@@ -742,16 +1405,22 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
       - Execution is restricted to workbench/scripts/ via WorkbenchRunner.
       - No git commit/push until the final response (i.e., when next_action is None).
     """
+    from src.artifact_manager import GLOBAL_ARTIFACTS
+
     session_id = datetime.now().strftime("%Y-%m-%d")
 
-    file_paths = _extract_attached_files(tokens[1:])
+    file_paths, scope = _parse_impl_flags(tokens, start=1)
+
+    # Start building the context now; it overlaps with the attached-file reads
+    # and the time spent in nano.
+    ctx_future = _CTX_POOL.submit(GLOBAL_CONTEXT.build_context_with_summary, scope=scope)
+
     injection_text, _attached, ok = _build_adhoc_file_injection(file_paths)
     if not ok:
+        ctx_future.cancel()
         GLOBAL_CONSOLE.print("❌ Action cancelled: one or more attached files could not be read.")
         return
 
-    scope = _extract_scope(tokens[1:])
-
     instruction = ""
     usage_stats: dict = {}
 
@@ -766,10 +1435,13 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
     # Track hot-deployed files to ensure they are committed
     hot_deployed_files: list[Path] = []
 
+    exec_pool: ThreadPoolExecutor | None = None
+
     try:
         instruction = get_input_from_editor("Describe the prompt/task for Albert's AI brain")
 
         if not instruction.strip():
+            ctx_future.cancel()
             GLOBAL_CONSOLE.print("❌ Action cancelled: Empty instruction.")
             return
 
@@ -777,13 +1449,18 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
             instruction = f"{instruction.rstrip()}\n\n{injection_text.lstrip()}"
 
         GLOBAL_CONSOLE.print(f"Building project context (Scope: {scope})...")
-        project_context = GLOBAL_CONTEXT.build_full_context(scope=scope)
+        project_context, ctx_summary = ctx_future.result()
+        GLOBAL_CONSOLE.print(ctx_summary)
 
         # Initial user prompt (turn 0)
         current_user_prompt = f"{instruction}\n\n{project_context}"
 
         runner = WorkbenchRunner(project_root=GLOBAL_CONFIG.project_root, timeout_s=60)
 
+        # Rebound scripts run on a worker thread so the wrapper can do its own
+        # per-turn bookkeeping (ledger, prompt assembly) while the script runs.
+        exec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rebound-exec")
+
         while True:
             loop_idx += 1
             if loop_idx > MAX_LOOPS:
@@ -792,15 +1469,27 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
 
             GLOBAL_CONSOLE.print(f"Requesting Architect AI (expecting JSON)... [turn {loop_idx}/{MAX_LOOPS}]")
 
+            # Traceability: the AI brain response is echoed to the screen as it
+            # streams in, then the complete block is written to the transcript.
+            streaming = False
+
+            def _echo_delta(piece: str) -> None:
+                nonlocal streaming
+                if not streaming:
+                    streaming = True
+                    GLOBAL_CONSOLE.echo("[AI_RESPONSE_BEGIN]\n")
+                GLOBAL_CONSOLE.echo(piece)
+
             json_response, usage_stats = client.send_chat_request(
                 system_prompt=SYSTEM_PROMPT_ARCHITECT,
                 user_prompt=current_user_prompt,
+                on_delta=_echo_delta,
             )
 
-            # Traceability: print AI brain response to screen + transcript.
-            GLOBAL_CONSOLE.print("[AI_RESPONSE_BEGIN]")
-            GLOBAL_CONSOLE.print(json_response or "")
-            GLOBAL_CONSOLE.print("[AI_RESPONSE_END]")
+            if not streaming:
+                GLOBAL_CONSOLE.echo("[AI_RESPONSE_BEGIN]\n")
+            GLOBAL_CONSOLE.echo("\n[AI_RESPONSE_END]\n")
+            GLOBAL_CONSOLE.log_block(["[AI_RESPONSE_BEGIN]", json_response or "", "[AI_RESPONSE_END]"])
 
             step_id = _generate_step_id()
             final_step_id = step_id
@@ -864,8 +1553,11 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
                 if found_artifact_path:
                     dest_path = GLOBAL_CONFIG.project_root / target_script
                     try:
+                        import shutil  # rebound hot-deploy only
+
                         dest_path.parent.mkdir(parents=True, exist_ok=True)
                         shutil.copy(found_artifact_path, dest_path)
+                        _DEST_READ_CACHE.pop(Path(os.path.normpath(dest_path)), None)
                         GLOBAL_CONSOLE.print(f"⚡ Auto-deployed script to: {dest_path}")
                         # Track for final commit
                         hot_deployed_files.append(dest_path)
@@ -874,20 +1566,17 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
                 # ----------------------------------
 
                 # Execute script (sandboxed)
-                GLOBAL_CONSOLE.print("--- REBOUND EXECUTION (autonomous) ---")
-                GLOBAL_CONSOLE.print(f"Next Action Type: {na_type}")
-                GLOBAL_CONSOLE.print(f"Target Script: {target_script}")
-
-                rc, out, err = runner.run_script(rel_to_workbench, script_args=[])
+                GLOBAL_CONSOLE.write_block(
+                    [
+                        "--- REBOUND EXECUTION (autonomous) ---",
+                        f"Next Action Type: {na_type}",
+                        f"Target Script: {target_script}",
+                    ]
+                )
 
-                # Print intermediate outputs to console/transcript
-                GLOBAL_CONSOLE.print(f"Return code: {rc}")
-                GLOBAL_CONSOLE.print("[STDOUT]")
-                GLOBAL_CONSOLE.print((out or "").rstrip("\n") if (out or "").strip() else "(empty)")
-                GLOBAL_CONSOLE.print("[STDERR]")
-                GLOBAL_CONSOLE.print((err or "").rstrip("\n") if (err or "").strip() else "(empty)")
+                exec_future = exec_pool.submit(runner.run_script, rel_to_workbench, [])
 
-                # Ledger log intermediate step
+                # Ledger log intermediate step (overlaps with the script run)
                 GLOBAL_LEDGER.log_event(
                     actor="wrapper",
                     action_type="rebound_exec",
@@ -898,6 +1587,19 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
                     ],
                 )
 
+                rc, out, err = exec_future.result()
+
+                # Print intermediate outputs to console/transcript
+                GLOBAL_CONSOLE.write_block(
+                    [
+                        f"Return code: {rc}",
+                        "[STDOUT]",
+                        (out or "").rstrip("\n") if (out or "").strip() else "(empty)",
+                        "[STDERR]",
+                        (err or "").rstrip("\n") if (err or "").strip() else "(empty)",
+                    ]
+                )
+
                 # Construct chaining prompt
                 system_output_block = (
                     "System Output:\n"
@@ -920,6 +1622,9 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
         all_generated_files = []
         usage_stats = {}
         final_step_id = final_step_id or _generate_step_id()
+    finally:
+        if exec_pool is not None:
+            exec_pool.shutdown(wait=False)
 
     # Final step: review/apply only if we have a final step folder and any generated files
     if final_step_id and all_generated_files:
@@ -928,7 +1633,9 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
         # NOTE: We implicitly review the last folder. If multiple folders, we rely on cumulative effect or last step containing deliverables.
 
         commit_message_hint = (instruction or "").strip() or f"Prompt changes ({final_step_id})"
-        should_apply = review_and_apply(artifact_folder=artifact_folder, commit_message=commit_message_hint)
+        should_apply, artifact_files = review_and_apply(
+            artifact_folder=artifact_folder, commit_message=commit_message_hint
+        )
 
         if should_apply:
             # --- SMART DEPLOYMENT CALL ---
@@ -937,6 +1644,7 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
                 user_instruction=instruction,
                 client=client,
                 hot_deployed_files=hot_deployed_files,
+                artifact_files=artifact_files,
             )
 
             if success:
@@ -981,6 +1689,15 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
     else:
         GLOBAL_CONSOLE.error("No files generated.")
 
+    # Nothing new to record when this flow generated no file. Otherwise hash and
+    # write the manifest off the critical path so the prompt comes back at once.
+    if all_generated_files:
+        _MANIFEST_POOL.submit(_generate_and_report_manifest, session_id)
+
+
+def _generate_and_report_manifest(session_id: str) -> None:
+    from src.artifact_manager import GLOBAL_ARTIFACTS
+
     try:
         manifest_rel = GLOBAL_ARTIFACTS.generate_session_manifest(session_id=session_id)
         if manifest_rel:
@@ -991,6 +1708,51 @@ def _run_prompt_flow(tokens: list[str], client: AIClient) -> None:
         GLOBAL_CONSOLE.error(f"Manifest generation failed: {e}")
 
 
+_REPL_COMMANDS = ("prompt", "implement", "exec", "batch", "test_ai", "status", "report", "help", "clear", "exit", "quit")
+_HISTORY_FILE = Path.home() / ".albert_history"
+
+
+def _complete_command(text: str, state: int) -> str | None:
+    # Only the command word (first token) is completed.
+    if readline.get_begidx() != 0:
+        return None
+    matches = [c for c in _REPL_COMMANDS if c.startswith(text)]
+    return matches[state] if state < len(matches) else None
+
+
+def _setup_readline() -> None:
+    """Persistent REPL history (~/.albert_history) and tab completion of commands.
+
+    Auto-history is disabled so that review answers (y/n/a/abort) and other
+    prompts do not pollute the history; the REPL adds its commands explicitly.
+    """
+    if readline is None:
+        return
+    try:
+        readline.read_history_file(str(_HISTORY_FILE))
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    readline.set_auto_history(False)
+    readline.set_completer(_complete_command)
+    readline.parse_and_bind("tab: complete")
+
+    def _save_history() -> None:
+        try:
+            readline.write_history_file(str(_HISTORY_FILE))
+        except OSError:
+            pass
+
+    atexit.register(_save_history)
+
+
+def _new_ai_client() -> "AIClient":
+    # Runs on the pool thread: the openai SDK import is paid there too.
+    from src.ai_client import AIClient
+
+    return AIClient()
+
+
 def main():
     GLOBAL_CONSOLE.print("--- ALBERT (Your Personal AI Steward) ---")
 
@@ -1002,19 +1764,24 @@ def main():
     parser.add_argument("mode", nargs="?", default="interactive")
     _args = parser.parse_args()
 
+    # Construct the AI client (API key, SDK HTTP client) while the user types the
+    # first command; a construction error surfaces on the first AI command, as before.
+    client_future = _CTX_POOL.submit(_new_ai_client)
     client = None
 
     _safe_runner = SafeCommandRunner(cwd=str(GLOBAL_CONFIG.project_root))
     _ = _safe_runner  # reserved for future CLI exposure
 
+    _setup_readline()
+
     try:
         while True:
             user_input = GLOBAL_CONSOLE.input(
-                f"[{GLOBAL_CONFIG.project_root}]\nCommand (prompt, implement, exec, test_ai, status, report, help, clear, exit): "
+                f"[{GLOBAL_CONFIG.project_root}]\nCommand (prompt, implement, exec, batch, test_ai, status, report, help, clear, exit): "
             )
 
             try:
-                tokens = shlex.split(user_input)
+                tokens = _fast_tokens(user_input)
             except ValueError as e:
                 GLOBAL_CONSOLE.error(f"Failed to parse command: {e}")
                 continue
@@ -1022,6 +1789,9 @@ def main():
             if not tokens:
                 continue
 
+            if readline is not None:
+                readline.add_history(user_input)
+
             cmd = tokens[0].strip().lower()
 
             if cmd in ["exit", "quit"]:
@@ -1032,7 +1802,12 @@ def main():
                 continue
 
             if cmd == "clear":
-                os.system("clear")
+                if sys.platform == "win32":
+                    os.system("cls")
+                else:
+                    # Home + clear screen + clear scrollback: no shell/terminfo fork.
+                    sys.stdout.write("\033[H\033[2J\033[3J")
+                    sys.stdout.flush()
                 continue
 
             if cmd == "status":
@@ -1047,9 +1822,15 @@ def main():
                 _cmd_exec(tokens)
                 continue
 
+            if cmd == "batch":
+                if not client:
+                    client = client_future.result()
+                _cmd_batch(tokens, client)
+                continue
+
             if cmd == "test_ai":
                 if not client:
-                    client = AIClient()
+                    client = client_future.result()
 
                 GLOBAL_CONSOLE.print("Waiting for AI...")
                 response_text, _stats = client.send_chat_request("You are helpful.", "Say Hello")
@@ -1059,14 +1840,14 @@ def main():
             # New canonical command
             if cmd == "prompt":
                 if not client:
-                    client = AIClient()
+                    client = client_future.result()
                 _run_prompt_flow(tokens=tokens, client=client)
                 continue
 
             # Backward-compatible alias
             if cmd == "implement":
                 if not client:
-                    client = AIClient()
+                    client = client_future.result()
                 GLOBAL_CONSOLE.print("ℹ️  'implement' is deprecated; use 'prompt' instead.")
                 _run_prompt_flow(tokens=tokens, client=client)
                 continue
@@ -1075,6 +1856,10 @@ def main():
 
     except KeyboardInterrupt:
         sys.exit(0)
+    finally:
+        # Release the client's keep-alive connections (one pool for the whole session).
+        if client:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -11,11 +11,38 @@ def _is_excluded_dir(dir_name: str) -> bool:
 
 
 def _walk_filtered(root: pathlib.Path):
-    """Yield (dirpath, dirnames, filenames) like os.walk, but prunes excluded dirs."""
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Prune in-place so os.walk does not descend into excluded directories
-        dirnames[:] = [d for d in dirnames if not _is_excluded_dir(d)]
-        yield pathlib.Path(dirpath), list(dirnames), list(filenames)
+    """Yield (dirpath, dirnames, filenames) like os.walk, but prunes excluded dirs.
+
+    Iterative os.scandir walk: the entry type comes from the directory listing
+    (no extra stat per entry). Same classification as os.walk: symlinks to
+    directories are listed as dirnames but not descended into; unreadable
+    directories are skipped. Visit order differs (callers index by path).
+    """
+    excluded = EXCLUDED_DIR_NAMES.__contains__  # bound once: no helper frame per entry
+    stack = [str(root)]
+    while stack:
+        top = stack.pop()
+        try:
+            it = os.scandir(top)
+        except OSError:
+            continue
+
+        dirnames: list[str] = []
+        filenames: list[str] = []
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                elif not excluded(entry.name):
+                    dirnames.append(entry.name)
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+
+        yield pathlib.Path(top), dirnames, filenames
 
 
 def _build_tree_index(root: pathlib.Path):
@@ -23,10 +50,11 @@ def _build_tree_index(root: pathlib.Path):
     index: dict[pathlib.Path, dict[str, list[pathlib.Path] | list[str]]] = {}
 
     for dirpath, dirnames, filenames in _walk_filtered(root):
+        # The walker hands over fresh lists: sort them in place, no copies.
+        dirnames.sort()
+        filenames.sort()
         # Normalize to Path objects
-        subdirs = [dirpath / d for d in sorted(dirnames)]
-        files = sorted(filenames)
-        index[dirpath] = {"subdirs": subdirs, "files": files}
+        index[dirpath] = {"subdirs": [dirpath / d for d in dirnames], "files": filenames}
 
     # Ensure root exists in index even if os.walk yields nothing (e.g., permission issues)
     index.setdefault(root, {"subdirs": [], "files": []})
@@ -34,50 +62,61 @@ def _build_tree_index(root: pathlib.Path):
 
 
 def _print_tree(root: pathlib.Path, index) -> None:
-    """Print an ASCII tree for the directory structure."""
-    print(str(root))
+    """Print an ASCII tree for the directory structure.
 
-    def recurse(dirpath: pathlib.Path, prefix: str) -> None:
-        children_dirs: list[pathlib.Path] = list(index.get(dirpath, {}).get("subdirs", []))
-        children_files: list[str] = list(index.get(dirpath, {}).get("files", []))
+    Iterative (explicit stack, no recursion limit on deep trees); lines are
+    collected and written to stdout in a single call.
+    """
+    out: list[str] = [str(root)]
 
+    def push_children(stack: list, dirpath: pathlib.Path, prefix: str) -> None:
+        entry = index.get(dirpath, {})
         # Combine children in a stable order: dirs first, then files
-        children = [("dir", p) for p in children_dirs] + [("file", dirpath / f) for f in children_files]
-
-        for i, (kind, child) in enumerate(children):
-            is_last = i == (len(children) - 1)
+        children = [(p, True) for p in entry.get("subdirs", [])]
+        children += [(dirpath / f, False) for f in entry.get("files", [])]
+        last = len(children) - 1
+        # Pushed in reverse so they are popped (and printed) in order.
+        for i in range(last, -1, -1):
+            child, is_dir = children[i]
+            is_last = i == last
             branch = "└── " if is_last else "├── "
             next_prefix = prefix + ("    " if is_last else "│   ")
-
-            if kind == "dir":
-                print(f"{prefix}{branch}{child.name}/")
-                recurse(child, next_prefix)
+            if is_dir:
+                stack.append((f"{prefix}{branch}{child.name}/", child, next_prefix))
             else:
-                print(f"{prefix}{branch}{child.name}")
-
-    recurse(root, "")
+                stack.append((f"{prefix}{branch}{child.name}", None, next_prefix))
 
+    stack: list = []
+    push_children(stack, root, "")
+    while stack:
+        line, subdir, next_prefix = stack.pop()
+        out.append(line)
+        if subdir is not None:
+            push_children(stack, subdir, next_prefix)
 
-def _dir_has_any_file_recursively(dirpath: pathlib.Path, index) -> bool:
-    """Return True if dirpath contains at least one file in its subtree (excluding pruned dirs)."""
-    entry = index.get(dirpath)
-    if not entry:
-        return False
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
-    files: list[str] = list(entry.get("files", []))
-    if files:
-        return True
 
-    for subdir in entry.get("subdirs", []):
-        if _dir_has_any_file_recursively(subdir, index):
-            return True
+def _compute_has_file(index) -> dict[pathlib.Path, bool]:
+    """Map each indexed directory to True if its subtree holds at least one file.
 
-    return False
+    Single bottom-up pass: directories are visited deepest first, so every subdir
+    is already resolved when its parent is evaluated (linear in the number of dirs).
+    """
+    has_file: dict[pathlib.Path, bool] = {}
+    for dirpath in sorted(index.keys(), key=lambda p: len(p.parts), reverse=True):
+        entry = index[dirpath]
+        has_file[dirpath] = bool(entry.get("files")) or any(
+            has_file.get(subdir, False) for subdir in entry.get("subdirs", [])
+        )
+    return has_file
 
 
 def _find_effectively_empty_dirs(root: pathlib.Path, index) -> list[pathlib.Path]:
     """Directories that contain no files anywhere under them (recursively), considering exclusions."""
     empties: list[pathlib.Path] = []
+    has_file = _compute_has_file(index)
 
     # Evaluate all directories discovered by the filtered walk
     for dirpath in sorted(index.keys(), key=lambda p: str(p)):
@@ -85,7 +124,7 @@ def _find_effectively_empty_dirs(root: pathlib.Path, index) -> list[pathlib.Path
         if _is_excluded_dir(dirpath.name):
             continue
 
-        if not _dir_has_any_file_recursively(dirpath, index):
+        if not has_file[dirpath]:
             empties.append(dirpath)
 
     # Prefer not to label the root as "empty" if it contains subdirs but no files;
@@ -1,3 +1,4 @@
+import re
 import shlex
 import subprocess
 from dataclasses import dataclass
@@ -22,7 +23,7 @@ class SafeCommandRunner:
       - Strict allowlist of commands.
       - Reject shell chaining / redirection characters.
       - Never uses shell=True.
-      - Parses using shlex.split.
+      - Parses using shlex.split (plain whitespace split when nothing is quoted/escaped).
 
     Note:
       This is not a full sandbox. It is a pragmatic, conservative guardrail.
@@ -44,17 +45,35 @@ class SafeCommandRunner:
     # Chaining / redirection characters to reject.
     # (We reject them entirely to avoid shell injection and piping.)
     _REJECT_TOKENS: tuple[str, ...] = ("&&", ";", "|", ">")
+    # All reject tokens in one compiled alternation: a single scan of the string.
+    _REJECT_RE = re.compile("|".join(re.escape(tok) for tok in _REJECT_TOKENS))
+
+    # shlex.split fast path: without quotes or escapes, shlex (posix, no comments)
+    # only splits on its whitespace set, which one compiled split reproduces.
+    _SHLEX_SPECIAL_RE = re.compile(r"[\"'\\]")
+    _SHLEX_WS_RE = re.compile(r"[ \t\r\n]+")
 
     def __init__(self, cwd: str | None = None):
         self.cwd = cwd
+        self._allow_trie = self._build_allow_trie(self.ALLOWLIST)
+
+    @staticmethod
+    def _build_allow_trie(allowlist: Iterable[str]) -> dict:
+        """Token trie of the allowlist: {token: {next_token: ..., None: True}}.
+
+        A None key marks the end of an allowed prefix, so a lookup costs one dict
+        access per command token, whatever the size of the allowlist.
+        """
+        trie: dict = {}
+        for allowed in allowlist:
+            node = trie
+            for tok in allowed.split():
+                node = node.setdefault(tok, {})
+            node[None] = True
+        return trie
 
     def _contains_rejected_tokens(self, command_str: str) -> bool:
-        if not command_str:
-            return False
-        for tok in self._REJECT_TOKENS:
-            if tok in command_str:
-                return True
-        return False
+        return bool(command_str) and self._REJECT_RE.search(command_str) is not None
 
     def _is_allowlisted(self, tokens: list[str]) -> bool:
         """Check whether tokenized command matches allowlist.
@@ -67,15 +86,13 @@ class SafeCommandRunner:
         if not tokens:
             return False
 
-        for allowed in self.ALLOWLIST:
-            allowed_tokens = allowed.split()
-            if len(allowed_tokens) == 1:
-                if tokens[0] == allowed_tokens[0]:
-                    return True
-            else:
-                if tokens[: len(allowed_tokens)] == allowed_tokens:
-                    return True
-
+        node = self._allow_trie
+        for tok in tokens:
+            node = node.get(tok)
+            if node is None:
+                return False
+            if None in node:
+                return True
         return False
 
     def run_safe_command(self, command_str: str) -> SafeCommandResult:
@@ -99,10 +116,13 @@ class SafeCommandRunner:
             raise ValueError("Rejected unsafe shell operators (&&, ;, |, >)")
 
         # Split safely (no shell parsing beyond shlex).
-        try:
-            tokens = shlex.split(command_str)
-        except ValueError as e:
-            raise ValueError(f"Failed to parse command: {e}")
+        if self._SHLEX_SPECIAL_RE.search(command_str) is None:
+            tokens = [t for t in self._SHLEX_WS_RE.split(command_str) if t]
+        else:
+            try:
+                tokens = shlex.split(command_str)
+            except ValueError as e:
+                raise ValueError(f"Failed to parse command: {e}")
 
         if not tokens:
             raise ValueError("Empty command")
@@ -117,6 +137,7 @@ class SafeCommandRunner:
             text=True,
             check=False,
             cwd=self.cwd,
+            close_fds=False,  # no inheritable fds to sweep (PEP 446): cheaper spawn
         )
 
         return SafeCommandResult(
@@ -1,4 +1,5 @@
 import subprocess
+import sys
 from typing import Iterable
 
 from src.console import GLOBAL_CONSOLE
@@ -13,7 +14,8 @@ def run_git_command(command_list: list[str], cwd: str | None = None) -> bool:
         as a soft success (logs info/warning and continues).
 
     Returns:
-      True on success (including tolerant "nothing to commit"), otherwise raises.
+      True on success (including tolerant "nothing to commit"), False on a real
+      git error (already reported on the console).
 
     Note:
       This function is intentionally opinionated for the wrapper's Git workflow.
@@ -25,17 +27,15 @@ def run_git_command(command_list: list[str], cwd: str | None = None) -> bool:
     # ... existing setup ...
 
     # CRITICAL CHANGE: check=False to prevent auto-crash
-    result = subprocess.run(command_list, capture_output=True, text=True, check=False, cwd=cwd)
+    # close_fds=False: the wrapper's own fds are non-inheritable (PEP 446), so the
+    # child has nothing to close; skipping the fd sweep makes each git spawn cheaper.
+    result = subprocess.run(command_list, capture_output=True, text=True, check=False, cwd=cwd, close_fds=False)
 
     if result.returncode == 0:
         return True  # Success
 
-    stdout_l = (result.stdout or "").lower()
-
-    # Handle "Nothing to commit" as Success
-    if result.returncode == 1 and (
-        ("nothing to commit" in stdout_l) or ("working tree clean" in stdout_l)
-    ):
+    # Handle "Nothing to commit" as Success (only exit code 1 needs the text scan)
+    if result.returncode == 1 and _is_nothing_to_commit(result.stdout):
         # Keep message close to requested behavior; use console manager for transcript.
         GLOBAL_CONSOLE.print("ℹ️  Git: Nothing to commit. Proceeding...")
         return True  # FORCE SUCCESS
@@ -47,7 +47,13 @@ def run_git_command(command_list: list[str], cwd: str | None = None) -> bool:
     else:
         GLOBAL_CONSOLE.error("❌ Git Error: Unknown error")
 
-    raise subprocess.CalledProcessError(result.returncode, command_list, output=result.stdout, stderr=result.stderr)
+    return False
+
+
+def _is_nothing_to_commit(stdout: str | None) -> bool:
+    # git prints this status at the end of its output; lowercasing the tail is enough.
+    tail = (stdout or "")[-512:].lower()
+    return "nothing to commit" in tail or "working tree clean" in tail
 
 
 def git_commit_resilient(commit_message: str, cwd: str | None = None) -> bool:
@@ -55,29 +61,52 @@ def git_commit_resilient(commit_message: str, cwd: str | None = None) -> bool:
 
     This delegates to run_git_command so the tolerance logic is centralized.
     """
-    try:
-        return run_git_command(["git", "commit", "-m", commit_message], cwd=cwd)
-    except subprocess.CalledProcessError:
-        return False
+    return run_git_command(["git", "commit", "-m", commit_message], cwd=cwd)
 
 
 def git_run_ok(args: list[str], cwd: str | None = None) -> bool:
     """Run an arbitrary git subcommand and return True on success.
 
-    This uses run_git_command and converts exceptions to False.
+    This uses run_git_command (False on a git error).
     """
-    try:
-        return run_git_command(["git", *list(args or [])], cwd=cwd)
-    except subprocess.CalledProcessError:
-        return False
+    return run_git_command(["git", *list(args or [])], cwd=cwd)
+
+
+# Command-line budget per `git add` call: Windows caps a command line at 32767
+# characters; POSIX ARG_MAX is usually 2 MiB (argv + environment).
+_GIT_ARGV_BUDGET = 30000 if sys.platform == "win32" else 1_000_000
 
 
 def git_add_force_tracked_paths(paths: Iterable[str], cwd: str | None = None) -> bool:
     """Stage only the whitelisted versioned paths.
 
     Uses: git add -f -- <paths...>
+    Only the given paths are scanned (never `git add .`); a very long list is
+    split into as few calls as the command-line limit allows.
     """
     p = [str(x) for x in paths if str(x).strip()]
     if not p:
         return True
-    return git_run_ok(["add", "-f", "--", *p], cwd=cwd)
+
+    ok = True
+    batch: list[str] = []
+    size = 0
+    for path in p:
+        if batch and size + len(path) + 1 > _GIT_ARGV_BUDGET:
+            ok = git_run_ok(["add", "-f", "--", *batch], cwd=cwd) and ok
+            batch, size = [], 0
+        batch.append(path)
+        size += len(path) + 1
+    return git_run_ok(["add", "-f", "--", *batch], cwd=cwd) and ok
+
+
+def git_has_staged_changes(cwd: str | None = None) -> bool:
+    """Return True if the index differs from HEAD (something to commit).
+
+    Uses: git diff --cached --quiet (exit 1 = differences). Any other failure
+    (e.g. no HEAD yet) is reported as True so the caller still attempts the commit.
+    """
+    result = subprocess.run(
+        ["git", "diff", "--cached", "--quiet"], capture_output=True, check=False, cwd=cwd, close_fds=False
+    )
+    return result.returncode != 0
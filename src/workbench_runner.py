@@ -1,11 +1,116 @@
+import atexit
+import functools
+import os
+import selectors
+import stat
 import subprocess
 import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
 from src.config import GLOBAL_CONFIG
 
 
+# Warm standby interpreter (POSIX): a `python -c` process started ahead of time
+# that waits for "script\0arg\0..." on stdin, then runs that script as __main__.
+# Each standby serves exactly one run (fresh process, same isolation as
+# `python script.py`); the next one is started once the run is over, off the
+# critical path, so interpreter start-up is not paid while the user waits.
+# An uncaught exception is printed without the bootstrap's own frame and exits
+# with 1, so stderr matches a direct `python script.py` run.
+_STANDBY_BOOTSTRAP = """
+def _boot():
+    import os, sys
+    data = sys.stdin.buffer.read()
+    if not data:
+        raise SystemExit(0)
+    argv = data.decode("utf-8", "surrogateescape").split("\\0")
+    sys.argv = argv
+    sys.path[0] = os.path.dirname(argv[0])
+    g = globals()
+    del g["_boot"]
+    g["__file__"] = argv[0]
+    with open(argv[0], "rb") as f:
+        return compile(f.read(), argv[0], "exec")
+try:
+    exec(_boot())
+except SystemExit:
+    raise
+except BaseException as _e:
+    import traceback
+    traceback.print_exception(type(_e), _e, _e.__traceback__.tb_next)
+    raise SystemExit(1)
+"""
+
+# Per-stream capture cap: beyond this only the tail of the output is kept, so a
+# script printing hundreds of MB of logs cannot blow up the wrapper's memory.
+_CAPTURE_LIMIT = 8 * 1024 * 1024
+
+_STANDBY: dict[str, subprocess.Popen] = {}  # cwd -> idle standby
+_STANDBY_LOCK = threading.Lock()
+
+
+def _spawn_standby(cwd: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", _STANDBY_BOOTSTRAP],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        close_fds=False,  # see _run_captured
+    )
+
+
+def _take_standby(cwd: str) -> subprocess.Popen | None:
+    with _STANDBY_LOCK:
+        proc = _STANDBY.pop(cwd, None)
+    if proc is not None and proc.poll() is not None:
+        _discard_standby(proc)  # died while idle
+        return None
+    return proc
+
+
+def _refill_standby(cwd: str) -> None:
+    with _STANDBY_LOCK:
+        if cwd in _STANDBY:
+            return
+        try:
+            _STANDBY[cwd] = _spawn_standby(cwd)
+        except OSError:
+            pass
+
+
+def _discard_standby(proc: subprocess.Popen) -> None:
+    for pipe in (proc.stdin, proc.stdout, proc.stderr):
+        try:
+            pipe.close()  # stdin EOF makes an idle standby exit on its own
+        except OSError:
+            pass
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+@atexit.register
+def _shutdown_standbys() -> None:
+    with _STANDBY_LOCK:
+        procs = list(_STANDBY.values())
+        _STANDBY.clear()
+    for proc in procs:
+        _discard_standby(proc)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_workbench(project_root: Path) -> tuple[Path, Path]:
+    """(resolved project root, resolved workbench/scripts dir), shared by all runners."""
+    root = project_root.resolve()
+    return root, (root / "workbench" / "scripts").resolve()
+
+
 @dataclass(frozen=True)
 class WorkbenchRunResult:
     returncode: int
@@ -30,8 +135,11 @@ class WorkbenchRunner:
       - Accepts a *relative* path (no absolute paths).
       - Resolves it relative to `<project_root>/workbench/scripts/`.
       - Verifies the resolved path stays inside `workbench/scripts/`.
-      - Executes with `subprocess.run` (no shell) and a hard timeout.
-      - Captures stdout/stderr.
+      - Executes with `subprocess.Popen` (no shell) and a hard timeout.
+      - Captures stdout/stderr (pipes drained as data arrives; only the last
+        8 MiB of each stream are kept).
+      - POSIX: after the first run, scripts start in a pre-started interpreter
+        (one fresh process per run); the script's stdin is empty (EOF).
 
     Notes:
       - This runner is intentionally narrow: it is not a general command runner.
@@ -39,9 +147,10 @@ class WorkbenchRunner:
     """
 
     def __init__(self, project_root: Path | None = None, timeout_s: int = 60):
-        self.project_root = (project_root or GLOBAL_CONFIG.project_root).resolve()
+        self.project_root, self.workbench_scripts_dir = _resolved_workbench(
+            Path(project_root or GLOBAL_CONFIG.project_root)
+        )
         self.timeout_s = int(timeout_s)
-        self.workbench_scripts_dir = (self.project_root / "workbench" / "scripts").resolve()
 
     def _resolve_and_validate(self, script_rel_to_workbench: str) -> Path:
         rel = (script_rel_to_workbench or "").strip()
@@ -61,10 +170,13 @@ class WorkbenchRunner:
         except Exception:
             raise ValueError("Blocked: script path is outside workbench/scripts/")
 
-        if not candidate.exists():
+        # One stat() for both checks (exists + regular file).
+        try:
+            st = os.stat(candidate)
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"Script not found: {candidate}")
 
-        if not candidate.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Not a file: {candidate}")
 
         if candidate.suffix.lower() != ".py":
@@ -88,22 +200,118 @@ class WorkbenchRunner:
         script_path = self._resolve_and_validate(script_rel_to_workbench)
         args = list(script_args or [])
 
+        cmd = [sys.executable, str(script_path), *args]
+
         try:
-            proc = subprocess.run(
-                [sys.executable, str(script_path), *args],
-                capture_output=True,
-                text=True,
-                check=False,
-                cwd=str(self.project_root),
-                timeout=self.timeout_s,
-            )
-            return int(proc.returncode), (proc.stdout or ""), (proc.stderr or "")
+            if os.name == "nt":
+                # selectors cannot poll pipes on Windows.
+                proc = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    cwd=str(self.project_root),
+                    timeout=self.timeout_s,
+                )
+                return int(proc.returncode), (proc.stdout or ""), (proc.stderr or "")
+            rc, out, err, timed_out = self._run_captured(cmd)
         except subprocess.TimeoutExpired as e:
+            rc, timed_out = 124, True
             out = (getattr(e, "stdout", None) or "")
             err = (getattr(e, "stderr", None) or "")
+        except Exception as e:
+            return 1, "", f"[WRAPPER] Workbench script execution failed: {e}"
+
+        if timed_out:
             if err:
                 err += "\n"
             err += f"[WRAPPER] Workbench script timed out after {self.timeout_s}s"
             return 124, out, err
-        except Exception as e:
-            return 1, "", f"[WRAPPER] Workbench script execution failed: {e}"
+        return rc, out, err
+
+    def _run_captured(self, cmd: list[str]) -> tuple[int, str, str, bool]:
+        """Run cmd, draining stdout/stderr with a selector as data arrives.
+
+        The timeout is a wall-clock deadline; on expiry the process is killed and
+        the output read so far is kept. Returns (returncode, stdout, stderr, timed_out).
+        """
+        cwd = str(self.project_root)
+        proc = _take_standby(cwd)
+        if proc is not None:
+            try:
+                proc.stdin.write("\0".join(cmd[1:]).encode("utf-8", "surrogateescape"))
+                proc.stdin.close()
+            except OSError:
+                _discard_standby(proc)
+                proc = None
+        if proc is None:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,  # same as a standby run
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                # The wrapper's fds are non-inheritable (PEP 446) and our pipes go
+                # through stdio only: no fd sweep needed in the child.
+                close_fds=False,
+            )
+        try:
+            return self._drain(proc)
+        finally:
+            _refill_standby(cwd)
+
+    def _drain(self, proc: subprocess.Popen) -> tuple[int, str, str, bool]:
+        deadline = time.monotonic() + self.timeout_s
+        out_fd, err_fd = proc.stdout.fileno(), proc.stderr.fileno()
+        bufs = {out_fd: bytearray(), err_fd: bytearray()}
+        dropped = {out_fd: 0, err_fd: 0}
+        timed_out = False
+
+        try:
+            with selectors.DefaultSelector() as sel:
+                for fd in bufs:
+                    sel.register(fd, selectors.EVENT_READ)
+                while sel.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                    for key, _events in sel.select(remaining):
+                        chunk = os.read(key.fd, 65536)
+                        if chunk:
+                            buf = bufs[key.fd]
+                            buf += chunk
+                            # Trim in bulk (at 2x the cap) to keep the cost amortized.
+                            if len(buf) > 2 * _CAPTURE_LIMIT:
+                                cut = len(buf) - _CAPTURE_LIMIT
+                                del buf[:cut]
+                                dropped[key.fd] += cut
+                        else:
+                            sel.unregister(key.fd)
+
+            if not timed_out:
+                try:
+                    proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    timed_out = True
+        finally:
+            if timed_out or proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        return (
+            int(proc.returncode),
+            _decode_output(bufs[out_fd], dropped[out_fd]),
+            _decode_output(bufs[err_fd], dropped[err_fd]),
+            timed_out,
+        )
+
+
+def _decode_output(data: bytearray, dropped: int = 0) -> str:
+    # Same result as text=True for the common case (UTF-8, \r\n normalized).
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+    if dropped:
+        text = f"[WRAPPER] Output truncated: first {dropped} bytes dropped\n" + text
+    return text
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.workbench_runner import _STANDBY, WorkbenchRunner
+
+_RAISING_SCRIPT = """\
+print("before")
+
+def fail():
+    raise ValueError("boom")
+
+try:
+    fail()
+except ValueError as e:
+    raise KeyError("chained") from e
+"""
+
+
+@unittest.skipIf(os.name == "nt", "warm standby interpreter is POSIX only")
+class StandbyParityTest(unittest.TestCase):
+    def test_raising_script_same_output_direct_and_standby(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts = Path(tmp) / "workbench" / "scripts"
+            scripts.mkdir(parents=True)
+            (scripts / "boom.py").write_text(_RAISING_SCRIPT, encoding="utf-8")
+            runner = WorkbenchRunner(project_root=Path(tmp), timeout_s=30)
+
+            # First run of this project root: direct Popen, then a standby is started.
+            direct = runner.run_script("boom.py")
+            self.assertIn(str(runner.project_root), _STANDBY)
+            standby = runner.run_script("boom.py")
+
+            self.assertEqual(direct, standby)
+            rc, out, err = standby
+            self.assertEqual(rc, 1)
+            self.assertEqual(out, "before\n")
+            self.assertNotIn('File "<string>"', err)
+            self.assertTrue(err.rstrip().endswith("KeyError: 'chained'"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,22 +32,30 @@ def main() -> int:
         print("ERROR: workbench/scripts directory not found")
         return 2
 
-    # Determine git tracked status using `git ls-files --error-unmatch`
+    # Determine git tracked status with a single `git ls-files -z -- <paths...>`
+    # (a path is tracked iff git lists it back).
     untracked: list[str] = []
     missing: list[str] = []
     tracked: list[str] = []
 
+    present: dict[str, str] = {}  # repo-relative posix path -> script name
     for name in TARGET_SCRIPTS:
         path = scripts_dir / name
         if not path.exists():
             missing.append(name)
             continue
+        present[path.relative_to(repo_root).as_posix()] = name
 
-        rc, _, err = run(["git", "-C", str(repo_root), "ls-files", "--error-unmatch", str(path.relative_to(repo_root))])
+    listed: set[str] = set()
+    if present:
+        rc, out, _ = run(["git", "-C", str(repo_root), "ls-files", "-z", "--", *present])
         if rc == 0:
+            listed = set(out.split("\0"))
+
+    for rel, name in present.items():
+        if rel in listed:
             tracked.append(name)
         else:
-            # When untracked, git prints: "error: pathspec ... did not match any file(s) known to git"
             untracked.append(name)
 
     print("\n--- Target scripts status ---")
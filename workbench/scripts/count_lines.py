@@ -7,11 +7,17 @@ import sys
 
 def count_lines_exact(path: Path) -> int:
     # Exact line count = number of '\n' line breaks plus 1 if file is non-empty and doesn't end with '\n'
-    # But the simplest exact definition for "number of lines" in text files is:
-    #   len(file.read().splitlines())
-    # which counts the last line even if it lacks a trailing newline.
-    text = path.read_text(encoding="utf-8", errors="replace")
-    return len(text.splitlines())
+    # (same result as len(text.splitlines()) for LF / CRLF text files).
+    # Counted on raw 1 MiB blocks: no decode, no per-line string, bounded memory.
+    n = 0
+    last = b""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            n += block.count(b"\n")
+            last = block[-1:]
+    if last and last != b"\n":
+        n += 1
+    return n
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -11,32 +11,45 @@ def _run_git(args: list[str]) -> subprocess.CompletedProcess:
     )
 
 
-def main() -> int:
-    # 1) Collect staged file list
-    proc_names = _run_git(["diff", "--cached", "--name-only"])
-    if proc_names.returncode != 0:
-        sys.stderr.write("ERROR: Failed to run: git diff --cached --name-only\n")
-        if (proc_names.stderr or "").strip():
-            sys.stderr.write(proc_names.stderr)
-        return 2
+def _split_numstat_z(output: str) -> tuple[list[str], str]:
+    """Split `git diff --numstat -z --stat` output into (staged paths, --stat text).
 
-    names = [ln.strip() for ln in (proc_names.stdout or "").splitlines() if ln.strip()]
+    The NUL-terminated numstat records come first ("adds\tdels\tpath", or
+    "adds\tdels\t" + old + new for a rename); the --stat block follows the last NUL.
+    """
+    parts = output.split("\0")
+    records, stat = parts[:-1], parts[-1]
+    names: list[str] = []
+    i = 0
+    while i < len(records):
+        path = records[i].split("\t", 2)[-1]
+        if path:
+            i += 1
+        else:  # rename / copy: keep the new path, like --name-only
+            path = records[i + 2] if i + 2 < len(records) else ""
+            i += 3
+        if path:
+            names.append(path)
+    return names, stat
 
-    # 2) Collect staged stat
-    proc_stat = _run_git(["diff", "--cached", "--stat"])
-    if proc_stat.returncode != 0:
-        sys.stderr.write("ERROR: Failed to run: git diff --cached --stat\n")
-        if (proc_stat.stderr or "").strip():
-            sys.stderr.write(proc_stat.stderr)
+
+def main() -> int:
+    # 1) Collect staged file list and stat in one git call
+    proc = _run_git(["diff", "--cached", "--numstat", "-z", "--stat"])
+    if proc.returncode != 0:
+        sys.stderr.write("ERROR: Failed to run: git diff --cached --numstat -z --stat\n")
+        if (proc.stderr or "").strip():
+            sys.stderr.write(proc.stderr)
         return 2
 
-    stat = (proc_stat.stdout or "").rstrip("\n")
+    names, stat = _split_numstat_z(proc.stdout or "")
+    stat = stat.rstrip("\n")
 
     # 3) Print summary
     print("=== GIT PRE-COMMIT SUMMARY (staged / --cached) ===")
 
     if not names:
-        print("No staged files detected. (git diff --cached --name-only is empty)")
+        print("No staged files detected. (git diff --cached is empty)")
         print("\nTip: stage changes with: git add <files>\n")
         return 0
 
@@ -1,15 +1,48 @@
 import json
+import os
+import sys
 from pathlib import Path
 
+# Optional C JSON encoder (falls back to the stdlib).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # This script is intended to be executed by the wrapper's Safe System Inspection tool runner.
 # It only prints read-only inspection information.
 
 
 def _read_text(p: Path) -> str:
     try:
-        return p.read_text(encoding="utf-8", errors="replace")
+        data = p.read_bytes()
     except Exception as e:
         return f"[ERROR READING {p}: {e}]"
+    # Strict decode first (fast path for valid UTF-8); replace only if needed.
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")  # as read_text (universal newlines)
+
+
+def _list_files(top: Path, root: Path) -> list[str]:
+    """Root-relative paths of the files under top (os.scandir walk; symlinked dirs not followed)."""
+    out: list[str] = []
+    stack = [str(top)]
+    root_prefix = len(str(root)) + 1
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue  # skipped, as rglob does
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    out.append(entry.path[root_prefix:])
+    return out
 
 
 def main() -> int:
@@ -60,7 +93,7 @@ def main() -> int:
         p = root / d
         if p.exists() and p.is_dir():
             try:
-                report["tree_snippets"][d] = sorted([str(x.relative_to(root)) for x in p.rglob("*") if x.is_file()])[:200]
+                report["tree_snippets"][d] = sorted(_list_files(p, root))[:200]
             except Exception as e:
                 report["tree_snippets"][d] = [f"[ERROR: {e}]"]
         else:
@@ -68,7 +101,18 @@ def main() -> int:
 
     # Git status summary (read-only)
     # The wrapper will execute git commands; here we just print placeholders.
-    print(json.dumps(report, indent=2))
+    if orjson is not None:
+        # UTF-8 bytes straight to stdout; non-ASCII unescaped, as on the stdlib path.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+        return 0
+
+    # Streamed to stdout chunk by chunk (no second full copy of the report as one string).
+    out = sys.stdout
+    for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(report):
+        out.write(chunk)
+    out.write("\n")
     return 0
 
 
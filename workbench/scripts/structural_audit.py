@@ -1,11 +1,20 @@
 import os
 import sys
 from pathlib import Path
+from typing import NamedTuple
 
 
 EXCLUDED_DIR_NAMES = {".git", "__pycache__", "venv", "node_modules"}
 
 
+class DirEntry(NamedTuple):
+    subdirs: list[Path]
+    files: list[str]
+
+
+_NO_ENTRY = DirEntry([], [])  # directories os.walk could not list
+
+
 def _is_excluded_dir(name: str) -> bool:
     return name in EXCLUDED_DIR_NAMES
 
@@ -17,67 +26,67 @@ def _walk_filtered(root: Path):
         yield Path(dirpath), list(dirnames), list(filenames)
 
 
-def _build_index(root: Path) -> dict[Path, dict[str, object]]:
-    index: dict[Path, dict[str, object]] = {}
+def _build_index(root: Path) -> dict[Path, DirEntry]:
+    index: dict[Path, DirEntry] = {}
     for dirpath, dirnames, filenames in _walk_filtered(root):
-        index[dirpath] = {
-            "subdirs": [dirpath / d for d in sorted(dirnames)],
-            "files": sorted(filenames),
-        }
-    index.setdefault(root, {"subdirs": [], "files": []})
+        index[dirpath] = DirEntry([dirpath / d for d in sorted(dirnames)], sorted(filenames))
+    index.setdefault(root, _NO_ENTRY)
     return index
 
 
-def _print_tree(root: Path, index: dict[Path, dict[str, object]]) -> None:
-    print(str(root))
+def _print_tree(root: Path, index: dict[Path, DirEntry]) -> None:
+    """Print the tree iteratively (explicit stack) and write it to stdout in one call."""
+    out: list[str] = [str(root)]
 
-    def recurse(dirpath: Path, prefix: str) -> None:
-        entry = index.get(dirpath, {})
-        subdirs = list(entry.get("subdirs", []))
-        files = list(entry.get("files", []))
-
-        children: list[tuple[str, object]] = [("dir", p) for p in subdirs] + [("file", dirpath / f) for f in files]
-
-        for i, (kind, child) in enumerate(children):
-            is_last = i == (len(children) - 1)
+    def push_children(stack: list[tuple[str, Path | None, str]], dirpath: Path, prefix: str) -> None:
+        entry = index.get(dirpath, _NO_ENTRY)
+        children: list[tuple[Path, bool]] = [(p, True) for p in entry.subdirs]
+        children += [(dirpath / f, False) for f in entry.files]
+        last = len(children) - 1
+        # Reverse push: children pop in order.
+        for i in range(last, -1, -1):
+            child, is_dir = children[i]
+            is_last = i == last
             branch = "└── " if is_last else "├── "
             next_prefix = prefix + ("    " if is_last else "│   ")
-
-            if kind == "dir":
-                child_path: Path = child  # type: ignore[assignment]
-                print(f"{prefix}{branch}{child_path.name}/")
-                recurse(child_path, next_prefix)
+            if is_dir:
+                stack.append((f"{prefix}{branch}{child.name}/", child, next_prefix))
             else:
-                child_path: Path = child  # type: ignore[assignment]
-                print(f"{prefix}{branch}{child_path.name}")
-
-    recurse(root, "")
+                stack.append((f"{prefix}{branch}{child.name}", None, next_prefix))
 
+    stack: list[tuple[str, Path | None, str]] = []
+    push_children(stack, root, "")
+    while stack:
+        line, subdir, next_prefix = stack.pop()
+        out.append(line)
+        if subdir is not None:
+            push_children(stack, subdir, next_prefix)
 
-def _dir_has_any_file_recursively(dirpath: Path, index: dict[Path, dict[str, object]]) -> bool:
-    entry = index.get(dirpath)
-    if not entry:
-        return False
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
-    files = list(entry.get("files", []))
-    if files:
-        return True
 
-    for subdir in entry.get("subdirs", []):
-        if _dir_has_any_file_recursively(subdir, index):
-            return True
+def _compute_has_file(index: dict[Path, DirEntry]) -> dict[Path, bool]:
+    """Map each indexed directory to True if its subtree holds at least one file.
 
-    return False
+    Bottom-up (deepest directories first): each directory is evaluated once.
+    """
+    has_file: dict[Path, bool] = {}
+    for dirpath in sorted(index.keys(), key=lambda p: len(p.parts), reverse=True):
+        entry = index[dirpath]
+        has_file[dirpath] = bool(entry.files) or any(has_file.get(subdir, False) for subdir in entry.subdirs)
+    return has_file
 
 
-def _find_empty_directories(root: Path, index: dict[Path, dict[str, object]]) -> list[Path]:
+def _find_empty_directories(root: Path, index: dict[Path, DirEntry]) -> list[Path]:
     """Return directories that contain no files in their subtree (with exclusions applied)."""
     empties: list[Path] = []
+    has_file = _compute_has_file(index)
 
     for dirpath in sorted(index.keys(), key=lambda p: str(p)):
         if _is_excluded_dir(dirpath.name):
             continue
-        if not _dir_has_any_file_recursively(dirpath, index):
+        if not has_file[dirpath]:
             empties.append(dirpath)
 
     return empties
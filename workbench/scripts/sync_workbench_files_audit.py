@@ -3,13 +3,31 @@ import sys
 import json
 import hashlib
 import pathlib
+import stat
 import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
+
+# Optional C JSON encoder (falls back to the stdlib).
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
 
+# Digests from previous runs: {repo-relative path: [size, mtime_ns, sha256]}.
+# A file whose size and mtime are unchanged is not read again.
+HASH_CACHE_PATH = PROJECT_ROOT / ".albert_cache" / "hash_cache.json"
+
+# Same exclusions as src/scripts/structure_audit.py.
+EXCLUDED_DIR_NAMES = {".git", "__pycache__", "venv", "node_modules", ".idea", ".vscode"}
+
+SCRIPT_SUFFIXES = (".py", ".sh", ".md", ".txt")
+SCRIPT_PREFIXES = ("README",)
+
 
 @dataclass(frozen=True)
 class CmdResult:
@@ -24,21 +42,104 @@ def run(cmd: list[str]) -> CmdResult:
 
 
 def sha256(path: pathlib.Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
+
+
+def load_hash_cache() -> dict[str, list]:
+    try:
+        with open(HASH_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
-def list_files(base: pathlib.Path, patterns: Iterable[str]) -> list[pathlib.Path]:
-    out: list[pathlib.Path] = []
+def save_hash_cache(cache: dict[str, list]) -> None:
+    try:
+        HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = HASH_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, HASH_CACHE_PATH)
+    except OSError:
+        pass  # best effort: the next run simply rehashes
+
+
+def inventory(
+    files: list[tuple[pathlib.Path, os.stat_result]],
+    location: str,
+    by_name: defaultdict[str, dict[str, dict]],
+    cache: dict[str, list],
+    fresh: dict[str, list],
+    pool: ThreadPoolExecutor,
+) -> list[dict]:
+    """[{path, size, sha256}] in the order of `files`; only new/changed files are hashed.
+
+    Each entry is also registered as by_name[basename][location] (duplicate detection
+    without another pass). Reads digests from `cache`; records the current
+    [size, mtime_ns, sha256] of each listed file in `fresh` (so entries of deleted
+    files are dropped on save).
+    """
+    entries: list[dict] = []
+    pending: list[tuple[dict, pathlib.Path, int]] = []
+    for p, st in files:
+        key = rel(p)
+        entry = {"path": key, "size": st.st_size, "sha256": None}
+        cached = cache.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            entry["sha256"] = cached[2]
+            fresh[key] = cached
+        else:
+            pending.append((entry, p, st.st_mtime_ns))
+        entries.append(entry)
+        by_name[p.name][location] = entry
+
+    # hashlib releases the GIL while hashing: worker threads overlap reads and digests.
+    for (entry, p, mtime_ns), digest in zip(pending, pool.map(sha256, [p for _, p, _ in pending])):
+        entry["sha256"] = digest
+        fresh[entry["path"]] = [entry["size"], mtime_ns, digest]
+    return entries
+
+
+def list_files(
+    base: pathlib.Path, suffixes: tuple[str, ...], prefixes: tuple[str, ...] = ()
+) -> list[tuple[pathlib.Path, os.stat_result]]:
+    """(path, stat) of the regular files under base whose name ends with one of
+    `suffixes` or starts with one of `prefixes`.
+
+    Single os.scandir walk (excluded dirs pruned, symlinked dirs not followed); each
+    file is listed once even if it matches several rules. The stat taken here is
+    reused for the size and the hash-cache check.
+    """
+    out: list[tuple[pathlib.Path, os.stat_result]] = []
     if not base.exists():
         return out
-    for pat in patterns:
-        out.extend(base.rglob(pat))
-    out = [p for p in out if p.is_file()]
-    out.sort(key=lambda p: str(p))
+    stack = [str(base)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in EXCLUDED_DIR_NAMES:
+                        stack.append(entry.path)
+                elif name.endswith(suffixes) or name.startswith(prefixes):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # broken symlink
+                    if stat.S_ISREG(st.st_mode):
+                        out.append((pathlib.Path(entry.path), st))
+    out.sort(key=lambda item: str(item[0]))
     return out
 
 
@@ -77,38 +178,22 @@ def main() -> int:
     report["git"]["status_stderr"] = gs.stderr
 
     # 2) File inventories
-    wb_files = list_files(workbench_scripts, ["*.py", "*.sh", "*.md", "README*", "*.txt"])
-    ss_files = list_files(src_scripts, ["*.py", "*.sh", "*.md", "README*", "*.txt"])
-
-    for p in wb_files:
-        report["inventory"]["workbench_scripts"].append(
-            {
-                "path": rel(p),
-                "size": p.stat().st_size,
-                "sha256": sha256(p),
-            }
-        )
-
-    for p in ss_files:
-        report["inventory"]["src_scripts"].append(
-            {
-                "path": rel(p),
-                "size": p.stat().st_size,
-                "sha256": sha256(p),
-            }
-        )
+    wb_files = list_files(workbench_scripts, SCRIPT_SUFFIXES, SCRIPT_PREFIXES)
+    ss_files = list_files(src_scripts, SCRIPT_SUFFIXES, SCRIPT_PREFIXES)
+
+    # (basenames are indexed at the same time for step 3)
+    by_name: defaultdict[str, dict[str, dict]] = defaultdict(dict)
+    cache = load_hash_cache()
+    fresh: dict[str, list] = {}
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+        report["inventory"]["workbench_scripts"] = inventory(wb_files, "workbench", by_name, cache, fresh, pool)
+        report["inventory"]["src_scripts"] = inventory(ss_files, "src", by_name, cache, fresh, pool)
+    save_hash_cache(fresh)
 
     # 3) Detect duplicates by basename across locations
-    by_name: dict[str, dict[str, dict]] = {}
-    for entry in report["inventory"]["workbench_scripts"]:
-        name = pathlib.Path(entry["path"]).name
-        by_name.setdefault(name, {})["workbench"] = entry
-    for entry in report["inventory"]["src_scripts"]:
-        name = pathlib.Path(entry["path"]).name
-        by_name.setdefault(name, {})["src"] = entry
-
-    for name, locs in sorted(by_name.items(), key=lambda kv: kv[0]):
-        if "workbench" in locs and "src" in locs:
+
+    for name, locs in sorted(by_name.items()):
+        if len(locs) == 2:  # present in both workbench and src
             report["duplicates_by_basename"][name] = {
                 "workbench": locs["workbench"],
                 "src": locs["src"],
@@ -133,7 +218,13 @@ def main() -> int:
         )
 
     # 5) Print JSON report
-    print(json.dumps(report, indent=2))
+    if orjson is not None:
+        # UTF-8 bytes straight to stdout; non-ASCII unescaped, as on the stdlib path.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
 
     return 0
 